@@ -0,0 +1,48 @@
+"""LangChain callback handlers for agent tracing."""
+
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.callbacks import BaseCallbackHandler
+from loguru import logger
+
+
+class LoguruCallbackHandler(BaseCallbackHandler):
+    """
+    Trace agent steps through loguru instead of LangChain's verbose stdout printing.
+
+    Records go through the configured loguru sinks, so with ``enqueue=True``
+    the writes happen on a background thread rather than in the event loop.
+    """
+
+    def __init__(self) -> None:
+        self.log = logger.bind(component="agent")
+
+    def on_agent_action(self, action: AgentAction, *, run_id: UUID, **kwargs: Any) -> None:
+        """Log the tool the agent decided to call."""
+        self.log.debug(f"Agent action: {action.tool} with input: {action.tool_input}")
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Log the start of a tool call."""
+        self.log.debug(f"Tool started: {serialized.get('name', 'unknown')}")
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Log the (truncated) tool output."""
+        self.log.debug(f"Tool finished: {str(output)[:200]}")
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Log a failed tool call."""
+        self.log.warning(f"Tool error: {error}")
+
+    def on_agent_finish(self, finish: AgentFinish, *, run_id: UUID, **kwargs: Any) -> None:
+        """Log the agent's final answer."""
+        self.log.debug(f"Agent finished: {str(finish.return_values.get('output', ''))[:200]}")
@@ -2,20 +2,39 @@
 
 from langchain.agents import create_tool_calling_agent, AgentExecutor
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.messages import HumanMessage, AIMessage, BaseMessage, SystemMessage
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Deque, Dict, Any, List, Optional, Sequence, Tuple, Union
 from loguru import logger
-from datetime import datetime
+from collections import deque
+from functools import lru_cache
+import threading
 
-from .tools import get_all_tools
+from .callbacks import LoguruCallbackHandler
+from .tools import get_all_tools, get_openai_tool_specs, count_tool_spec_tokens, is_error_result
 from ..models.config import get_settings
 from ..services.llm import LLMService
-from ..utils.constants import DEFAULT_LLM_MODEL, DEFAULT_LLM_TEMPERATURE
+from ..services.llm_cache import LLMCache, get_llm_cache
+from ..services.mcp_client import get_mcp_client
+from ..utils.dates import get_today
+from ..utils.tokens import count_message_tokens, count_tokens
+from ..utils.constants import (
+    DEFAULT_LLM_MODEL,
+    DEFAULT_LLM_TEMPERATURE,
+    HISTORY_SUMMARY_MAX_CHARS,
+    HISTORY_SUMMARY_SNIPPET_CHARS,
+)
 
 # Module-level tool cache for performance
 _cached_tools: Optional[List] = None
 
+# Compiled agent executors keyed by (llm, tool names, prompt)
+_agent_cache: Dict[Tuple[int, Tuple[str, ...], int], AgentExecutor] = {}
+
+# Process-wide orchestrator (see get_orchestrator)
+_orchestrator: Optional["AgentOrchestrator"] = None
+_orchestrator_lock = threading.Lock()
+
 
 def get_cached_tools() -> List:
     """Get cached tools, creating them only once."""
@@ -33,23 +52,176 @@ def clear_tool_cache() -> None:
     logger.debug("Tool cache cleared")
 
 
+# Static agent instructions. Kept free of per-user and per-day values so the
+# system prefix is byte-identical across turns and OpenAI's automatic prompt
+# caching can reuse it; dynamic details go in a trailing block.
+AGENT_SYSTEM_PROMPT = """You are a personal morning assistant.
+You help with the user's daily routine by providing weather, calendar, todo, and commute information.
+
+You have access to these tools:
+- get_weather: Get weather forecasts
+- get_calendar: Get calendar events for a single date (use YYYY-MM-DD format)
+- get_calendar_range: Get calendar events for a date range (MUCH more efficient for week queries)
+- get_todos: Get todo/task lists
+- get_commute: Get basic travel information between any two locations
+- get_commute_options: Get comprehensive work commute analysis with driving vs transit (Caltrain + shuttle) options, real-time traffic, and AI recommendations
+- get_shuttle_schedule: Get MV Connector shuttle schedules for LinkedIn campus transportation
+- get_morning_briefing: Get complete morning summary
+
+IMPORTANT: For week/multi-day queries, ALWAYS use get_calendar_range instead of multiple get_calendar calls.
+Use get_calendar_range when users ask about "this week", "next week", "upcoming days", or any date range.
+
+Be helpful, concise, and friendly. When users ask general questions like "What's my day like?",
+use the morning briefing tool. For specific questions, use the appropriate individual tools.
+
+IMPORTANT: When users ask about "work schedule" or "work meetings", they mean their job/professional calendar.
+Currently only personal calendar, Runna (fitness), and Family calendars are available via API.
+If asked about work meetings specifically, explain that work calendar integration requires additional setup.
+
+CONVERSATION MEMORY: You have access to the conversation history. When users say things like "yes", "proceed",
+"do it", "go ahead", or reference previous messages, use the chat history to understand what they're referring to.
+Always maintain context from earlier in the conversation."""
+
+# Request sent to the agent for the smart morning briefing
+SMART_BRIEFING_INPUT = (
+    "Give me my complete morning briefing with weather, calendar, todos, and commute information. "
+    "Make it conversational and highlight the most important things."
+)
+
+
+@lru_cache(maxsize=4)
+def _build_prompt(
+    user_name: str,
+    user_location: str,
+    commute_origin: str,
+    commute_destination: str,
+    enable_memory: bool,
+) -> ChatPromptTemplate:
+    """
+    Build the agent prompt template, memoized per user settings.
+
+    The current date is a prompt variable filled in at invoke time, so the
+    template never goes stale and orchestrators share one instance.
+    """
+    context_block = f"""User preferences:
+- Name: {user_name}
+- Location: {user_location}
+- Default commute: {commute_origin} to {commute_destination}
+
+IMPORTANT: Today's date is {{current_date}} ({{current_day}}). When users ask about "today", "this morning", "my schedule", etc., use this date: {{current_date}}."""
+
+    # Build prompt messages - include chat_history placeholder if memory is enabled
+    prompt_messages = [
+        ("system", AGENT_SYSTEM_PROMPT),
+        ("system", context_block),
+    ]
+
+    # Add chat history placeholder if memory is enabled
+    if enable_memory:
+        prompt_messages.append(MessagesPlaceholder(variable_name="chat_history"))
+
+    prompt_messages.extend([
+        ("human", "{input}"),
+        ("placeholder", "{agent_scratchpad}")
+    ])
+
+    return ChatPromptTemplate.from_messages(prompt_messages)
+
+
+@lru_cache(maxsize=4)
+def _get_llm(api_key: str, model: str, temperature: float) -> ChatOpenAI:
+    """
+    Get a chat model, reusing one client per (api_key, model, temperature).
+
+    Each ChatOpenAI owns its own HTTP connection pool, so sharing the instance
+    keeps connections to OpenAI warm across orchestrators.
+    """
+    return ChatOpenAI(api_key=api_key, model=model, temperature=temperature)
+
+
+def clear_llm_cache() -> None:
+    """Clear the cached chat models (useful for testing)."""
+    _get_llm.cache_clear()
+
+
+def _build_agent(
+    llm: ChatOpenAI,
+    tools: List,
+    prompt: ChatPromptTemplate,
+) -> AgentExecutor:
+    """
+    Get the agent executor for an LLM, tool set and prompt, wiring it only once.
+
+    The LLM and prompt are themselves memoized, so their identities are stable
+    keys; tools are keyed by name. Tracing callbacks are passed per run rather
+    than bound here, since constructor callbacks don't reach tool runs.
+    """
+    key = (id(llm), tuple(tool.name for tool in tools), id(prompt))
+    executor = _agent_cache.get(key)
+    if executor is None:
+        logger.debug("Building LangChain agent executor")
+        # Bind precomputed tool specs so schemas aren't re-derived per build
+        agent = create_tool_calling_agent(llm, get_openai_tool_specs(tools), prompt)
+        executor = AgentExecutor(
+            agent=agent,
+            tools=tools,
+            # Tool calls are checked before an answer is cached
+            return_intermediate_steps=True,
+        )
+        _agent_cache[key] = executor
+    return executor
+
+
+def clear_agent_cache() -> None:
+    """Clear the compiled agent executors (useful for testing)."""
+    _agent_cache.clear()
+
+
+def _date_context() -> Dict[str, str]:
+    """Get the date variables expected by the agent prompt."""
+    current_date, current_day = get_today()
+    return {"current_date": current_date, "current_day": current_day}
+
+
 class AgentOrchestrator:
     """Main orchestrator for the AI agent."""
 
-    def __init__(self, use_cached_tools: bool = True, enable_memory: Optional[bool] = None) -> None:
+    def __init__(
+        self,
+        use_cached_tools: bool = True,
+        enable_memory: Optional[bool] = None,
+        max_history_turns: Optional[int] = None,
+    ) -> None:
         """
         Initialize the agent orchestrator.
 
         Args:
             use_cached_tools: Whether to use cached tools (True for production)
             enable_memory: Whether to enable conversation memory (defaults to settings.enable_memory)
+            max_history_turns: Exchanges kept in memory, 0 for unbounded (defaults to settings.max_history_turns)
         """
         self.settings = get_settings()
-        self.llm_service = LLMService()
+        # Share the cached chat model with the LLM service when one is configured
+        self.llm_service = LLMService(llm=self._shared_llm())
+        self.response_cache = get_llm_cache()
 
         # Initialize conversation memory based on settings or override
         self.enable_memory = enable_memory if enable_memory is not None else self.settings.enable_memory
-        self.chat_history: List[BaseMessage] = []
+        self.max_history_turns = (
+            max_history_turns if max_history_turns is not None else self.settings.max_history_turns
+        )
+        # A bounded deque evicts the oldest message in O(1) as new ones arrive
+        self.chat_history: Deque[BaseMessage] = deque(
+            maxlen=2 * self.max_history_turns if self.max_history_turns > 0 else None
+        )
+        self._history_summary = ""
+        # Tokens in the system prompt and tool specs, counted once the agent is built
+        self._prompt_tokens = 0
+        # Step tracing only when debugging; run-time callbacks are inherited by
+        # tool runs, so tool starts, ends and errors are logged too
+        self._run_config: Dict[str, Any] = (
+            {"callbacks": [LoguruCallbackHandler()]} if self.settings.debug else {}
+        )
 
         if self.enable_memory:
             logger.info("Conversation memory enabled")
@@ -61,6 +233,9 @@ class AgentOrchestrator:
             self.tools = get_cached_tools()
         else:
             self.tools = get_all_tools()
+        self._read_only_tools = frozenset(
+            tool.name for tool in self.tools if getattr(tool, "read_only", False)
+        )
 
         # Initialize LangChain agent if OpenAI is available
         if self.settings.openai_api_key:
@@ -69,71 +244,39 @@ class AgentOrchestrator:
             self.agent: Optional[AgentExecutor] = None
             logger.warning("No OpenAI API key - conversational features disabled")
 
+    def _shared_llm(self) -> Optional[ChatOpenAI]:
+        """Get the process-wide chat model for the configured API key, if any."""
+        if not self.settings.openai_api_key:
+            return None
+        return _get_llm(
+            self.settings.openai_api_key,
+            DEFAULT_LLM_MODEL,
+            DEFAULT_LLM_TEMPERATURE,
+        )
+
     def _init_langchain_agent(self) -> None:
         """Initialize the LangChain agent with tools."""
         try:
-            # Create the LLM
-            llm = ChatOpenAI(
-                api_key=self.settings.openai_api_key,
-                model=DEFAULT_LLM_MODEL,
-                temperature=DEFAULT_LLM_TEMPERATURE,
+            # Get the (shared) LLM client
+            llm = self._shared_llm()
+
+            # Build (or reuse) the prompt template for the user settings
+            prompt = _build_prompt(
+                self.settings.user_name,
+                self.settings.user_location,
+                self.settings.default_commute_origin,
+                self.settings.default_commute_destination,
+                self.enable_memory,
             )
 
-            # Create the prompt template with current date
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            current_day = datetime.now().strftime("%A, %B %d, %Y")
-
-            # Build prompt messages - include chat_history placeholder if memory is enabled
-            prompt_messages = [
-                ("system", f"""You are {self.settings.user_name}'s personal morning assistant.
-You help with their daily routine by providing weather, calendar, todo, and commute information.
-
-IMPORTANT: Today's date is {current_date} ({current_day}). When users ask about "today", "this morning", "my schedule", etc., use this date: {current_date}.
-
-User preferences:
-- Name: {self.settings.user_name}
-- Location: {self.settings.user_location}
-- Default commute: {self.settings.default_commute_origin} to {self.settings.default_commute_destination}
-
-You have access to these tools:
-- get_weather: Get weather forecasts
-- get_calendar: Get calendar events for a single date (use YYYY-MM-DD format, today is {current_date})
-- get_calendar_range: Get calendar events for a date range (MUCH more efficient for week queries)
-- get_todos: Get todo/task lists
-- get_commute: Get basic travel information between any two locations
-- get_commute_options: Get comprehensive work commute analysis with driving vs transit (Caltrain + shuttle) options, real-time traffic, and AI recommendations
-- get_shuttle_schedule: Get MV Connector shuttle schedules for LinkedIn campus transportation
-- get_morning_briefing: Get complete morning summary
-
-IMPORTANT: For week/multi-day queries, ALWAYS use get_calendar_range instead of multiple get_calendar calls.
-Use get_calendar_range when users ask about "this week", "next week", "upcoming days", or any date range.
-
-Be helpful, concise, and friendly. When users ask general questions like "What's my day like?",
-use the morning briefing tool. For specific questions, use the appropriate individual tools.
-
-IMPORTANT: When users ask about "work schedule" or "work meetings", they mean their job/professional calendar.
-Currently only personal calendar, Runna (fitness), and Family calendars are available via API.
-If asked about work meetings specifically, explain that work calendar integration requires additional setup.
-
-CONVERSATION MEMORY: You have access to the conversation history. When users say things like "yes", "proceed",
-"do it", "go ahead", or reference previous messages, use the chat history to understand what they're referring to.
-Always maintain context from earlier in the conversation."""),
-            ]
-
-            # Add chat history placeholder if memory is enabled
-            if self.enable_memory:
-                prompt_messages.append(MessagesPlaceholder(variable_name="chat_history"))
-
-            prompt_messages.extend([
-                ("human", "{input}"),
-                ("placeholder", "{agent_scratchpad}")
-            ])
+            # Create (or reuse) the agent
+            self.agent = _build_agent(llm, self.tools, prompt)
 
-            prompt = ChatPromptTemplate.from_messages(prompt_messages)
-
-            # Create the agent
-            agent = create_tool_calling_agent(llm, self.tools, prompt)
-            self.agent = AgentExecutor(agent=agent, tools=self.tools, verbose=True)
+            # Fixed per-request token cost, used to keep history within budget
+            system_messages = prompt.format_messages(
+                input="", chat_history=[], agent_scratchpad=[], **_date_context()
+            )
+            self._prompt_tokens = count_message_tokens(system_messages) + count_tool_spec_tokens(self.tools)
 
             logger.info("LangChain agent initialized successfully")
 
@@ -158,21 +301,30 @@ Always maintain context from earlier in the conversation."""),
             logger.info(f"Processing user input: {user_input}")
 
             # Build the invoke payload
-            invoke_payload: Dict[str, Any] = {"input": user_input}
+            invoke_payload: Dict[str, Any] = {"input": user_input, **_date_context()}
 
             # Include chat history if memory is enabled
             if self.enable_memory:
-                invoke_payload["chat_history"] = self.chat_history
+                self._fit_history_to_budget(user_input)
+                invoke_payload["chat_history"] = self._history_for_prompt()
                 logger.debug(f"Including {len(self.chat_history)} messages in chat history")
 
-            # Use the agent to process the input
-            result = await self.agent.ainvoke(invoke_payload)
-            response = result.get("output", "I'm not sure how to help with that.")
+            # Reuse an identical recent or in-flight answer, otherwise ask the agent
+            cache_key = self._response_cache_key(
+                user_input, invoke_payload["current_date"], invoke_payload.get("chat_history", [])
+            )
+
+            async def ask_agent() -> Tuple[str, bool]:
+                result = await self.agent.ainvoke(invoke_payload, config=self._run_config)
+                output = result.get("output", "I'm not sure how to help with that.")
+                return output, self._is_cacheable(result, output)
+
+            response = await self.response_cache.get_or_compute(cache_key, ask_agent)
 
             # Store the conversation in memory if enabled
             if self.enable_memory:
-                self.chat_history.append(HumanMessage(content=user_input))
-                self.chat_history.append(AIMessage(content=response))
+                self._remember(HumanMessage(content=user_input))
+                self._remember(AIMessage(content=response))
                 logger.debug(f"Chat history now has {len(self.chat_history)} messages")
 
             logger.info("Successfully generated response")
@@ -182,6 +334,59 @@ Always maintain context from earlier in the conversation."""),
             logger.error(f"Error in chat processing: {e}")
             return f"Sorry, I encountered an error: {str(e)}"
 
+    async def chat_batch(
+        self,
+        inputs: Sequence[Union[str, Tuple[str, List[BaseMessage]]]],
+    ) -> List[str]:
+        """
+        Handle several independent inputs concurrently.
+
+        Inputs are dispatched through ``AgentExecutor.abatch`` so LLM and tool
+        round trips overlap instead of running back to back. Each input is
+        either a plain string, which sees the current conversation history, or
+        a ``(text, history)`` tuple for a separate session. Batched turns are
+        not written back to this orchestrator's memory.
+
+        Args:
+            inputs: User inputs, optionally paired with their own chat history
+
+        Returns:
+            One response per input, in the same order
+        """
+        if not self.agent:
+            return [
+                "I need an OpenAI API key to have conversations. Try the specific commands like 'briefing' or 'weather' instead!"
+            ] * len(inputs)
+
+        if not inputs:
+            return []
+
+        date_context = _date_context()
+        shared_history = self._history_for_prompt() if self.enable_memory else []
+        payloads: List[Dict[str, Any]] = []
+        for item in inputs:
+            text, history = item if isinstance(item, tuple) else (item, shared_history)
+            payload: Dict[str, Any] = {"input": text, **date_context}
+            if self.enable_memory:
+                payload["chat_history"] = list(history)
+            payloads.append(payload)
+
+        logger.info(f"Processing batch of {len(payloads)} inputs")
+        results = await self.agent.abatch(
+            payloads,
+            config={"max_concurrency": self.settings.max_concurrency, **self._run_config},
+            return_exceptions=True,
+        )
+
+        responses = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in batch chat processing: {result}")
+                responses.append(f"Sorry, I encountered an error: {str(result)}")
+            else:
+                responses.append(result.get("output", "I'm not sure how to help with that."))
+        return responses
+
     async def get_smart_briefing(self) -> str:
         """
         Get an AI-generated morning briefing.
@@ -190,26 +395,201 @@ Always maintain context from earlier in the conversation."""),
             Natural language morning briefing
         """
         try:
-            # Get all the morning data
-            today = datetime.now().strftime('%Y-%m-%d')
+            date_context = _date_context()
 
             # Use the morning briefing tool through the agent if available
             if self.agent:
-                result = await self.agent.ainvoke({
-                    "input": "Give me my complete morning briefing with weather, calendar, todos, and commute information. Make it conversational and highlight the most important things."
-                })
-                return result.get("output", "Error generating briefing")
+                cache_key = self._response_cache_key(SMART_BRIEFING_INPUT, date_context["current_date"], [])
+                async def ask_agent() -> Tuple[str, bool]:
+                    result = await self.agent.ainvoke(
+                        {"input": SMART_BRIEFING_INPUT, **date_context}, config=self._run_config
+                    )
+                    output = result.get("output", "Error generating briefing")
+                    return output, self._is_cacheable(result, output)
+
+                return await self.response_cache.get_or_compute(cache_key, ask_agent)
             else:
-                # Fallback to direct tool call
-                from ..services.mcp_client import MCPClient
-                client = MCPClient()
-                data = await client.get_all_morning_data(today)
+                # Fallback to direct tool calls; get_all_morning_data fetches
+                # weather, calendar, todos and commute concurrently
+                client = get_mcp_client()
+                data = await client.get_all_morning_data(date_context["current_date"])
                 return await self.llm_service.generate_morning_briefing(data)
 
         except Exception as e:
             logger.error(f"Error generating smart briefing: {e}")
             return f"Error generating briefing: {str(e)}"
 
+    def _is_cacheable(self, result: Dict[str, Any], output: str) -> bool:
+        """
+        Check whether an agent answer may be served again from the cache.
+
+        Only answers built from read-only tool calls that all succeeded are
+        reused: replaying a write would skip it, and replaying a failure would
+        hide the service recovering until the entry expires.
+        """
+        if is_error_result(output):
+            return False
+        return all(
+            self._is_cacheable_tool_call(action.tool, observation)
+            for action, observation in result.get("intermediate_steps", [])
+        )
+
+    def _is_cacheable_tool_call(self, name: str, output: Any) -> bool:
+        """Check that a tool call was read-only and succeeded."""
+        return name in self._read_only_tools and not is_error_result(output)
+
+    def _response_cache_key(
+        self,
+        user_input: str,
+        current_date: str,
+        history: List[BaseMessage],
+    ) -> str:
+        """Build the response cache key for an agent call (scoped to the current day)."""
+        return LLMCache.make_key(
+            model=DEFAULT_LLM_MODEL,
+            input=LLMCache.normalize_input(user_input),
+            date=current_date,
+            user=[
+                self.settings.user_name,
+                self.settings.user_location,
+                self.settings.default_commute_origin,
+                self.settings.default_commute_destination,
+            ],
+            tools=sorted(tool.name for tool in self.tools),
+            history=[(message.type, message.content) for message in history],
+        )
+
+    def _remember(self, message: BaseMessage) -> None:
+        """
+        Add a message to memory, keeping only the last ``max_history_turns`` exchanges.
+
+        Every turn re-sends the whole history, so unbounded memory makes
+        per-turn cost grow with conversation length. The message the deque is
+        about to evict is folded into a short running summary instead of
+        being dropped outright.
+        """
+        if self.chat_history.maxlen is not None and len(self.chat_history) == self.chat_history.maxlen:
+            self._summarize_evicted(self.chat_history[0])
+        self.chat_history.append(message)
+
+    def _fit_history_to_budget(self, user_input: str) -> None:
+        """
+        Evict the oldest exchanges until the request fits ``max_context_tokens``.
+
+        Counting locally catches an over-long history before paying for a
+        request the API would reject (or bill at full length).
+        """
+        budget = self.settings.max_context_tokens
+        if budget <= 0 or not self.chat_history:
+            return
+
+        fixed_tokens = self._prompt_tokens + count_tokens(user_input)
+        history_tokens = count_message_tokens(self.chat_history)
+        evicted = 0
+        # The summary grows with each eviction, so it is recounted every pass
+        while self.chat_history and fixed_tokens + count_tokens(self._history_summary) + history_tokens > budget:
+            # Evict whole exchanges so the history never opens with an orphan reply
+            turn = [self.chat_history.popleft()]
+            while self.chat_history and isinstance(self.chat_history[0], AIMessage):
+                turn.append(self.chat_history.popleft())
+            for message in turn:
+                self._summarize_evicted(message)
+                history_tokens -= count_tokens(str(message.content))
+            evicted += len(turn)
+
+        if evicted:
+            logger.info(f"Evicted {evicted} messages to stay within {budget} context tokens")
+
+    def _summarize_evicted(self, message: BaseMessage) -> None:
+        """Fold an evicted message into the running history summary."""
+        speaker = "User" if isinstance(message, HumanMessage) else "Assistant"
+        line = f"{speaker}: {str(message.content)[:HISTORY_SUMMARY_SNIPPET_CHARS]}"
+        summary = f"{self._history_summary}\n{line}" if self._history_summary else line
+        # Keep the most recent part of the summary when it outgrows the cap
+        self._history_summary = summary[-HISTORY_SUMMARY_MAX_CHARS:]
+
+    def _history_for_prompt(self) -> List[BaseMessage]:
+        """Get the history to send to the agent, led by the summary of older turns."""
+        if not self._history_summary:
+            return list(self.chat_history)
+        summary = SystemMessage(content=f"Summary of earlier conversation:\n{self._history_summary}")
+        return [summary, *self.chat_history]
+
+    async def submit_briefing_batch(self) -> str:
+        """
+        Fetch today's morning data and queue the briefing on the OpenAI Batch API.
+
+        Returns:
+            OpenAI batch ID to pass to collect_briefing_batch
+        """
+        current_date = _date_context()["current_date"]
+        data = await get_mcp_client().get_all_morning_data(current_date)
+        return await self.llm_service.submit_briefing_batch(data, custom_id=f"briefing-{current_date}")
+
+    async def collect_briefing_batch(self, batch_id: str) -> Optional[str]:
+        """
+        Get a batched morning briefing, if it is ready.
+
+        Args:
+            batch_id: ID returned by submit_briefing_batch
+
+        Returns:
+            Briefing text, or None if the batch is still running
+        """
+        return await self.llm_service.collect_briefing_batch(batch_id)
+
+    async def stream_smart_briefing(self) -> AsyncIterator[str]:
+        """
+        Stream an AI-generated morning briefing as it is generated.
+
+        Yields the final answer's tokens as they arrive, so the first words
+        show up after the tool calls instead of after the whole completion.
+
+        Yields:
+            Briefing text chunks
+        """
+        try:
+            date_context = _date_context()
+
+            if self.agent:
+                cache_key = self._response_cache_key(SMART_BRIEFING_INPUT, date_context["current_date"], [])
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    yield cached
+                    return
+
+                chunks: List[str] = []
+                cacheable = True
+                async for event in self.agent.astream_events(
+                    {"input": SMART_BRIEFING_INPUT, **date_context}, config=self._run_config, version="v2"
+                ):
+                    if event["event"] == "on_tool_end":
+                        output = event["data"].get("output")
+                        output = getattr(output, "content", output)
+                        if not self._is_cacheable_tool_call(event["name"], output):
+                            cacheable = False
+                        continue
+                    if event["event"] != "on_chat_model_stream":
+                        continue
+                    # Tool-call chunks carry no text content
+                    content = event["data"]["chunk"].content
+                    if content:
+                        chunks.append(content)
+                        yield content
+
+                if chunks and cacheable:
+                    self.response_cache.set(cache_key, "".join(chunks))
+            else:
+                # Fallback to direct tool calls
+                client = get_mcp_client()
+                data = await client.get_all_morning_data(date_context["current_date"])
+                async for chunk in self.llm_service.stream_morning_briefing(data):
+                    yield chunk
+
+        except Exception as e:
+            logger.error(f"Error streaming smart briefing: {e}")
+            yield f"Error generating briefing: {str(e)}"
+
     def is_conversational(self) -> bool:
         """Check if conversational features are available."""
         return self.agent is not None
@@ -217,6 +597,7 @@ Always maintain context from earlier in the conversation."""),
     def clear_memory(self) -> None:
         """Clear the conversation history to start a fresh session."""
         self.chat_history.clear()
+        self._history_summary = ""
         logger.info("Conversation memory cleared")
 
     def get_memory_length(self) -> int:
@@ -230,3 +611,24 @@ Always maintain context from earlier in the conversation."""),
     def has_memory(self) -> bool:
         """Check if memory is enabled and has messages stored."""
         return self.enable_memory and len(self.chat_history) > 0
+
+
+def get_orchestrator() -> AgentOrchestrator:
+    """
+    Get the process-wide orchestrator, creating it on first use.
+
+    Reusing one instance avoids rebuilding tools, the LLM client and the
+    LangChain agent for every CLI command or request.
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = AgentOrchestrator()
+    return _orchestrator
+
+
+def reset_orchestrator() -> None:
+    """Reset the process-wide orchestrator (useful for testing)."""
+    global _orchestrator
+    _orchestrator = None
@@ -1,15 +1,20 @@
 """LangChain tools that wrap MCP server calls."""
 
 from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from typing import Dict, Any, Optional, Type, List
 from pydantic import BaseModel, Field
-from datetime import datetime
-import asyncio
+import orjson
+from itertools import groupby, islice
+from operator import itemgetter
+from loguru import logger
 
-from ..services.mcp_client import MCPClient
+from ..services.mcp_client import MCPClient, get_mcp_client
 from ..models.config import get_settings
+from ..utils.dates import today_str
+from ..utils.async_helpers import run_coroutine_sync, gather_named
+from ..utils.tokens import count_tokens
 from ..utils.constants import (
-    FINANCIAL_SYMBOLS,
     SHUTTLE_STOP_NAMES,
     MAX_EVENTS_PER_DAY,
     MAX_HIGH_PRIORITY_TODOS,
@@ -18,6 +23,86 @@ from ..utils.constants import (
 )
 
 
+# Fixed section headers for the commute and shuttle tool output
+_DRIVING_HEADER = "\n🚗 **Driving:**"
+_TRANSIT_HEADER = "\n🚆 **Transit (Caltrain + Shuttle):**"
+_NEXT_TRAINS_HEADER = "   🕐 Next trains:"
+_NEXT_DEPARTURES_HEADER = "\n🚏 Next departures:"
+
+# Per-event lines for the calendar tools, as bound format methods
+_EVENT_LINE = "- {} at {}".format
+_TIMED_EVENT_LINE = "  - {} at {}".format
+_ALL_DAY_EVENT_LINE = "  - {} (all day)".format
+
+# Per-symbol lines for the financial tool, filled from each MCP data item
+_GAIN_LINE = "{symbol} ({name}): ${price:.2f} 📈 +${change:.2f} (+{change_percent:.1f}%)"
+_LOSS_LINE = "{symbol} ({name}): ${price:.2f} 📉 ${change:.2f} ({change_percent:.1f}%)"
+
+# Weather and commute summaries, filled straight from the MCP response
+_WEATHER_TEMPLATE = (
+    "Weather for {location}: {summary}, High: {temp_hi}°F, Low: {temp_lo}°F, "
+    "Precipitation: {precip_chance}%"
+)
+_COMMUTE_TEMPLATE = (
+    "🚗 {origin} to {destination} ({mode}):\n"
+    "⏱️ Duration: {duration_minutes} minutes\n"
+    "📏 Distance: {distance_miles} miles\n"
+    "🛣️ Route: {route_summary}"
+)
+
+
+class _Fields(dict):
+    """Template fields for str.format_map; any field missing from the data renders as 'N/A'."""
+
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
+
+def _fill(template: str, data: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None, **values: Any) -> str:
+    """
+    Fill a template from response data in a single format_map call.
+
+    Fields come from ``values`` first, then ``data``, then ``defaults``.
+    """
+    fields = _Fields(defaults or ())
+    fields.update(data)
+    fields.update(values)
+    return template.format_map(fields)
+
+
+class MCPTool(BaseTool):
+    """
+    Base class for tools backed by MCP server calls.
+
+    Subclasses implement ``_arun``; the shared client and the sync wrapper
+    (run on the long-lived background loop) are provided here. Tools that
+    change state on the server set ``read_only`` to False.
+    """
+
+    read_only: bool = True
+    
+    def _get_mcp_client(self) -> MCPClient:
+        """Get the shared MCP client instance."""
+        return get_mcp_client()
+    
+    def _run(self, *args: Any, **kwargs: Any) -> str:
+        """Sync wrapper for async call."""
+        return run_coroutine_sync(self._arun(*args, **kwargs))
+
+
+def _error_message(action: str, error: Exception) -> str:
+    """Describe a failed tool call for the agent, noting when a retry may succeed."""
+    message = f"Error {action}: {error}"
+    if getattr(error, "retriable", False):
+        message += " (temporary failure, worth retrying shortly)"
+    return message
+
+
+def is_error_result(output: Any) -> bool:
+    """Check whether a tool's output reports a failed call."""
+    return isinstance(output, str) and output.startswith(("Error ", "❌"))
+
+
 class WeatherInput(BaseModel):
     """Input schema for weather tool."""
     location: str = Field(description="Location to get weather for (city, state/country)")
@@ -80,42 +165,30 @@ class FinancialInput(BaseModel):
     data_type: str = Field(default="mixed", description="Type: 'stocks', 'crypto', or 'mixed'")
 
 
-class WeatherTool(BaseTool):
+class WeatherTool(MCPTool):
     """Tool to get weather forecasts."""
     
     name: str = "get_weather"
     description: str = "Get weather forecast for a location. Use this when users ask about weather, temperature, or conditions."
     args_schema: Type[BaseModel] = WeatherInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, location: str, when: str = "today") -> str:
         """Get weather forecast."""
         try:
             client = self._get_mcp_client()
             data = await client.get_weather(location, when)
-            return f"Weather for {data.get('location', location)}: {data.get('summary', 'N/A')}, High: {data.get('temp_hi', 'N/A')}°F, Low: {data.get('temp_lo', 'N/A')}°F, Precipitation: {data.get('precip_chance', 0)}%"
+            return _fill(_WEATHER_TEMPLATE, data, {"location": location, "precip_chance": 0})
         except Exception as e:
-            return f"Error getting weather: {str(e)}"
-    
-    def _run(self, location: str, when: str = "today") -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(location, when))
+            return _error_message("getting weather", e)
 
 
-class CalendarTool(BaseTool):
+class CalendarTool(MCPTool):
     """Tool to get calendar events."""
     
     name: str = "get_calendar"
     description: str = "Get calendar events for a specific date. Use when users ask about meetings, appointments, or schedule."
     args_schema: Type[BaseModel] = CalendarInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, date: str) -> str:
         """Get calendar events."""
         try:
@@ -127,34 +200,26 @@ class CalendarTool(BaseTool):
             if total == 0:
                 return f"No events scheduled for {date}"
             
-            event_summaries = []
-            for event in events[:3]:  # Show max 3 events
-                event_summaries.append(f"- {event.get('title', 'N/A')} at {event.get('time', 'N/A')}")
+            lines = [f"{total} events on {date}:"]
+            lines.extend(
+                _EVENT_LINE(event.get('title', 'N/A'), event.get('time', 'N/A'))
+                for event in islice(events, MAX_EVENTS_PER_DAY)
+            )
+            if total > MAX_EVENTS_PER_DAY:
+                lines.append(f"... and {total - MAX_EVENTS_PER_DAY} more events")
             
-            result = f"{total} events on {date}:\\n" + "\\n".join(event_summaries)
-            if total > 3:
-                result += f"\\n... and {total - 3} more events"
-            
-            return result
+            return "\n".join(lines)
         except Exception as e:
-            return f"Error getting calendar: {str(e)}"
-    
-    def _run(self, date: str) -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(date))
+            return _error_message("getting calendar", e)
 
 
-class CalendarRangeTool(BaseTool):
+class CalendarRangeTool(MCPTool):
     """Tool to get calendar events for a date range (more efficient than multiple single-date calls)."""
     
     name: str = "get_calendar_range"
     description: str = "Get calendar events for a date range. Use when users ask about their week, multiple days, or date ranges. Much more efficient than multiple single-date calls."
     args_schema: Type[BaseModel] = CalendarRangeInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, start_date: str, end_date: str) -> str:
         """Get calendar events for a date range."""
         try:
@@ -166,48 +231,44 @@ class CalendarRangeTool(BaseTool):
             if total == 0:
                 return f"No events scheduled from {start_date} to {end_date}"
             
-            # Group events by date for better readability
-            events_by_date = {}
+            # One pass over the events: (YYYY-MM-DD, HH:MM or None, title)
+            rows = []
             for event in events:
-                event_date = event.get('start_time', '')[:10]  # Extract YYYY-MM-DD
-                if event_date not in events_by_date:
-                    events_by_date[event_date] = []
-                events_by_date[event_date].append(event)
+                start = event.get('start_time') or ''
+                time_part = start[11:16] if start[10:11] == 'T' else None
+                rows.append((start[:10], time_part, event.get('title', 'N/A')))
+            rows.sort(key=itemgetter(0))  # Stable, so events keep their order within a day
             
+            # Group events by date for better readability
             result_lines = [f"{total} events from {start_date} to {end_date}:"]
-            for date, day_events in sorted(events_by_date.items()):
+            for date, day_rows in groupby(rows, key=itemgetter(0)):
                 result_lines.append(f"\n{date}:")
-                for event in day_events[:3]:  # Show max 3 events per day
-                    time_str = event.get('start_time', '')
-                    if 'T' in time_str:
-                        time_part = time_str.split('T')[1][:5]  # Extract HH:MM
-                        result_lines.append(f"  - {event.get('title', 'N/A')} at {time_part}")
-                    else:
-                        result_lines.append(f"  - {event.get('title', 'N/A')} (all day)")
+                day_count = 0
+                for _, time_part, title in day_rows:
+                    day_count += 1
+                    if day_count > MAX_EVENTS_PER_DAY:
+                        continue
+                    result_lines.append(
+                        _TIMED_EVENT_LINE(title, time_part) if time_part is not None
+                        else _ALL_DAY_EVENT_LINE(title)
+                    )
                 
-                if len(day_events) > 3:
-                    result_lines.append(f"  ... and {len(day_events) - 3} more")
+                if day_count > MAX_EVENTS_PER_DAY:
+                    result_lines.append(f"  ... and {day_count - MAX_EVENTS_PER_DAY} more")
             
-            return "\\n".join(result_lines)
+            return "\n".join(result_lines)
         except Exception as e:
-            return f"Error getting calendar range: {str(e)}"
-    
-    def _run(self, start_date: str, end_date: str) -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(start_date, end_date))
+            return _error_message("getting calendar range", e)
 
 
-class CalendarCreateTool(BaseTool):
+class CalendarCreateTool(MCPTool):
     """Tool to create new calendar events."""
     
     name: str = "create_calendar_event"
+    read_only: bool = False
     description: str = "Create a new calendar event. Use when users want to schedule meetings, appointments, or events. Supports conflict detection and natural language parsing."
     args_schema: Type[BaseModel] = CalendarCreateInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, title: str, start_time: str, end_time: str, 
                    description: Optional[str] = None, location: Optional[str] = None,
                    attendees: Optional[list] = None, calendar_name: str = "primary",
@@ -216,66 +277,54 @@ class CalendarCreateTool(BaseTool):
         try:
             client = self._get_mcp_client()
             
-            # Prepare the data for the MCP server
-            event_data = {
+            # Prepare the data for the MCP server, leaving out unset optional fields
+            event_data: Dict[str, Any] = {
                 "title": title,
                 "start_time": start_time,
                 "end_time": end_time,
-                "description": description,
-                "location": location,
-                "attendees": attendees,
                 "calendar_name": calendar_name,
                 "all_day": all_day
             }
-            
-            # Remove None values
-            event_data = {k: v for k, v in event_data.items() if v is not None}
+            if description is not None:
+                event_data["description"] = description
+            if location is not None:
+                event_data["location"] = location
+            if attendees is not None:
+                event_data["attendees"] = attendees
             
             result = await client.call_tool("calendar.create_event", event_data)
             
             if result.get('success'):
-                message = result.get('message', 'Event created successfully')
+                lines = [result.get('message', 'Event created successfully')]
                 conflicts = result.get('conflicts', [])
                 
                 if conflicts:
-                    conflict_details = []
-                    for conflict in conflicts:
-                        conflict_details.append(f"- {conflict.get('title', 'Unknown')} at {conflict.get('start_time', 'Unknown time')}")
-                    
-                    message += f"\\n\\n⚠️ Conflicts detected:\\n" + "\\n".join(conflict_details)
-                    message += "\\n\\nYou may want to reschedule one of these events."
+                    lines.extend(("", "⚠️ Conflicts detected:"))
+                    lines.extend(
+                        f"- {conflict.get('title', 'Unknown')} at {conflict.get('start_time', 'Unknown time')}"
+                        for conflict in conflicts
+                    )
+                    lines.extend(("", "You may want to reschedule one of these events."))
                 
                 # Add event URL if available
                 if result.get('event_url'):
-                    message += f"\\n\\n📅 View event: {result['event_url']}"
+                    lines.extend(("", f"📅 View event: {result['event_url']}"))
                 
-                return message
+                return "\n".join(lines)
             else:
                 return f"❌ Failed to create event: {result.get('message', 'Unknown error')}"
                 
         except Exception as e:
-            return f"❌ Error creating calendar event: {str(e)}"
-    
-    def _run(self, title: str, start_time: str, end_time: str, 
-             description: Optional[str] = None, location: Optional[str] = None,
-             attendees: Optional[list] = None, calendar_name: str = "primary",
-             all_day: bool = False) -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(title, start_time, end_time, description, 
-                                    location, attendees, calendar_name, all_day))
+            return f"❌ {_error_message('creating calendar event', e)}"
 
 
-class TodoTool(BaseTool):
+class TodoTool(MCPTool):
     """Tool to get todo items."""
     
     name: str = "get_todos"
     description: str = "Get todo/task items from different buckets. Use when users ask about tasks, todos, or what they need to do."
     args_schema: Type[BaseModel] = TodoInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, bucket: Optional[str] = None) -> str:
         """Get todo items."""
         try:
@@ -288,141 +337,127 @@ class TodoTool(BaseTool):
             if pending == 0:
                 return f"No pending {bucket_label} tasks"
             
-            # Show high priority items first
-            high_priority = [item for item in items if item.get('priority') == 'high']
-            other_items = [item for item in items if item.get('priority') != 'high']
-            
-            summaries = []
-            
-            # Add high priority items first
-            for item in high_priority[:2]:
-                summaries.append(f"🔥 HIGH: {item.get('title', 'N/A')}")
-            
-            # Add other items
-            for item in other_items[:3]:
-                priority = item.get('priority', 'medium').upper()
-                summaries.append(f"• {priority}: {item.get('title', 'N/A')}")
-            
-            result = f"{pending} pending {bucket_label} tasks:\\n" + "\\n".join(summaries)
-            if len(items) > 5:
-                result += f"\\n... and {len(items) - 5} more tasks"
-            
-            return result
+            # Pick the items to show in one pass, stopping once both quotas are filled
+            high_priority = []
+            other_items = []
+            for item in items:
+                if item.get('priority') == 'high':
+                    if len(high_priority) < MAX_HIGH_PRIORITY_TODOS:
+                        high_priority.append(item)
+                elif len(other_items) < MAX_OTHER_TODOS:
+                    other_items.append(item)
+                if len(high_priority) == MAX_HIGH_PRIORITY_TODOS and len(other_items) == MAX_OTHER_TODOS:
+                    break
+            
+            # High priority items first
+            lines = [f"{pending} pending {bucket_label} tasks:"]
+            lines.extend(f"🔥 HIGH: {item.get('title', 'N/A')}" for item in high_priority)
+            lines.extend(
+                f"• {item.get('priority', 'medium').upper()}: {item.get('title', 'N/A')}"
+                for item in other_items
+            )
+            if len(items) > MAX_TOTAL_TODOS_DISPLAY:
+                lines.append(f"... and {len(items) - MAX_TOTAL_TODOS_DISPLAY} more tasks")
+            
+            return "\n".join(lines)
         except Exception as e:
-            return f"Error getting todos: {str(e)}"
-    
-    def _run(self, bucket: Optional[str] = None) -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(bucket))
+            return _error_message("getting todos", e)
 
 
-class CommuteTool(BaseTool):
+class CommuteTool(MCPTool):
     """Tool to get basic commute information between any two locations."""
     
     name: str = "get_commute"
     description: str = "Get basic commute/travel information between any two locations. Use when users ask about travel time between specific places."
     args_schema: Type[BaseModel] = CommuteInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, origin: str, destination: str, mode: str = "driving") -> str:
         """Get commute information."""
         try:
             client = self._get_mcp_client()
             data = await client.get_commute(origin, destination, mode)
-            duration_min = data.get('duration_minutes', 0)
-            distance_miles = data.get('distance_miles', 0)
             traffic_status = data.get('traffic_status', 'N/A')
-            route_summary = data.get('route_summary', 'N/A')
             
-            result = f"🚗 {origin} to {destination} ({mode}):\n"
-            result += f"⏱️ Duration: {duration_min} minutes\n"
-            result += f"📏 Distance: {distance_miles} miles\n"
-            result += f"🛣️ Route: {route_summary}\n"
+            result = _fill(
+                _COMMUTE_TEMPLATE, data, {"duration_minutes": 0, "distance_miles": 0},
+                origin=origin, destination=destination, mode=mode,
+            )
             if traffic_status != "N/A":
-                result += f"🚦 Traffic: {traffic_status}"
+                result += f"\n🚦 Traffic: {traffic_status}"
                 
             return result
         except Exception as e:
-            return f"Error getting commute: {str(e)}"
-    
-    def _run(self, origin: str, destination: str, mode: str = "driving") -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(origin, destination, mode))
+            return _error_message("getting commute", e)
 
 
-class CommuteOptionsTool(BaseTool):
+class CommuteOptionsTool(MCPTool):
     """Tool to get comprehensive commute options with driving and transit for work commutes."""
     
     name: str = "get_commute_options"
     description: str = "Get comprehensive commute options comparing driving vs transit (Caltrain + shuttle) for work commutes. Use when users ask about their commute to/from work, best transportation option, or want detailed commute analysis."
     args_schema: Type[BaseModel] = CommuteOptionsInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, direction: str, departure_time: Optional[str] = None, 
                    include_driving: bool = True, include_transit: bool = True) -> str:
         """Get comprehensive commute options."""
+        if not include_driving and not include_transit:
+            # Nothing to compare; don't make the server compute either leg
+            return "No commute options requested: enable driving and/or transit."
+        
         try:
             client = self._get_mcp_client()
             data = await client.get_commute_options(direction, departure_time, include_driving, include_transit)
             
             direction_label = "to work" if direction == "to_work" else "from work"
-            result_parts = [f"🚌 Commute options {direction_label}:"]
-            
-            recommendation = data.get('recommendation', 'No recommendation available')
-            result_parts.append(f"\n💡 **Recommendation:** {recommendation}")
+            result_parts = [
+                f"🚌 Commute options {direction_label}:",
+                f"\n💡 **Recommendation:** {data.get('recommendation', 'No recommendation available')}",
+            ]
             
             # Driving option
-            if data.get('driving') and include_driving:
-                driving = data['driving']
-                result_parts.append(f"\n🚗 **Driving:**")
-                result_parts.append(f"   ⏱️ {driving.get('duration_minutes', 'N/A')} minutes")
-                result_parts.append(f"   🛣️ {driving.get('route_summary', 'N/A')}")
-                result_parts.append(f"   🚦 {driving.get('traffic_status', 'N/A')}")
-                result_parts.append(f"   🕐 Depart: {driving.get('departure_time', 'N/A')}")
-                result_parts.append(f"   🏁 Arrive: {driving.get('arrival_time', 'N/A')}")
+            driving = data.get('driving')
+            if driving and include_driving:
+                result_parts.extend((
+                    _DRIVING_HEADER,
+                    f"   ⏱️ {driving.get('duration_minutes', 'N/A')} minutes",
+                    f"   🛣️ {driving.get('route_summary', 'N/A')}",
+                    f"   🚦 {driving.get('traffic_status', 'N/A')}",
+                    f"   🕐 Depart: {driving.get('departure_time', 'N/A')}",
+                    f"   🏁 Arrive: {driving.get('arrival_time', 'N/A')}",
+                ))
             
             # Transit option
-            if data.get('transit') and include_transit:
-                transit = data['transit']
-                result_parts.append(f"\n🚆 **Transit (Caltrain + Shuttle):**")
-                result_parts.append(f"   ⏱️ Total: {transit.get('total_duration_minutes', 'N/A')} minutes")
-                result_parts.append(f"   🚂 Caltrain: {transit.get('caltrain_duration_minutes', 'N/A')} min")
-                result_parts.append(f"   🚌 Shuttle: {transit.get('shuttle_duration_minutes', 'N/A')} min")
+            transit = data.get('transit')
+            if transit and include_transit:
+                result_parts.extend((
+                    _TRANSIT_HEADER,
+                    f"   ⏱️ Total: {transit.get('total_duration_minutes', 'N/A')} minutes",
+                    f"   🚂 Caltrain: {transit.get('caltrain_duration_minutes', 'N/A')} min",
+                    f"   🚌 Shuttle: {transit.get('shuttle_duration_minutes', 'N/A')} min",
+                ))
                 
                 # Next departures
                 next_departures = transit.get('next_departures', [])
                 if next_departures:
-                    result_parts.append(f"   🕐 Next trains:")
-                    for i, dep in enumerate(next_departures[:2]):
-                        result_parts.append(f"      {i+1}. {dep.get('departure_time', 'N/A')} → {dep.get('arrival_time', 'N/A')} (Train {dep.get('train_number', 'N/A')})")
+                    result_parts.append(_NEXT_TRAINS_HEADER)
+                    result_parts.extend(
+                        f"      {i}. {dep.get('departure_time', 'N/A')} → {dep.get('arrival_time', 'N/A')} "
+                        f"(Train {dep.get('train_number', 'N/A')})"
+                        for i, dep in enumerate(islice(next_departures, 2), start=1)
+                    )
             
             return "\n".join(result_parts)
         except Exception as e:
-            return f"Error getting commute options: {str(e)}"
-    
-    def _run(self, direction: str, departure_time: Optional[str] = None, 
-             include_driving: bool = True, include_transit: bool = True) -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(direction, departure_time, include_driving, include_transit))
+            return _error_message("getting commute options", e)
 
 
-class ShuttleTool(BaseTool):
+class ShuttleTool(MCPTool):
     """Tool to get MV Connector shuttle schedules."""
     
     name: str = "get_shuttle_schedule"
     description: str = "Get MV Connector shuttle schedule between stops (Mountain View Caltrain, LinkedIn Transit Center). Use when users ask about shuttle times or LinkedIn campus transportation."
     args_schema: Type[BaseModel] = ShuttleScheduleInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, origin: str, destination: str, departure_time: Optional[str] = None) -> str:
         """Get shuttle schedule."""
         try:
@@ -433,99 +468,82 @@ class ShuttleTool(BaseTool):
             origin_name = SHUTTLE_STOP_NAMES.get(origin, origin)
             dest_name = SHUTTLE_STOP_NAMES.get(destination, destination)
             
-            result_parts = [f"🚌 MV Connector: {origin_name} → {dest_name}"]
-            result_parts.append(f"⏱️ Duration: {data.get('duration_minutes', 'N/A')} minutes")
-            result_parts.append(f"🕐 Service hours: {data.get('service_hours', 'N/A')}")
-            result_parts.append(f"⏲️ Frequency: Every {data.get('frequency_minutes', 'N/A')} minutes")
+            result_parts = [
+                f"🚌 MV Connector: {origin_name} → {dest_name}",
+                f"⏱️ Duration: {data.get('duration_minutes', 'N/A')} minutes",
+                f"🕐 Service hours: {data.get('service_hours', 'N/A')}",
+                f"⏲️ Frequency: Every {data.get('frequency_minutes', 'N/A')} minutes",
+            ]
             
             next_departures = data.get('next_departures', [])
             if next_departures:
-                result_parts.append("\n🚏 Next departures:")
-                for i, dep in enumerate(next_departures[:3]):
-                    result_parts.append(f"   {i+1}. {dep.get('departure_time', 'N/A')}")
+                result_parts.append(_NEXT_DEPARTURES_HEADER)
+                result_parts.extend(
+                    f"   {i}. {dep.get('departure_time', 'N/A')}"
+                    for i, dep in enumerate(islice(next_departures, 3), start=1)
+                )
             
             return "\n".join(result_parts)
         except Exception as e:
-            return f"Error getting shuttle schedule: {str(e)}"
-    
-    def _run(self, origin: str, destination: str, departure_time: Optional[str] = None) -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(origin, destination, departure_time))
+            return _error_message("getting shuttle schedule", e)
 
 
-class FinancialTool(BaseTool):
+class FinancialTool(MCPTool):
     """Tool to get financial data for stocks and cryptocurrencies."""
     
     name: str = "get_financial_data"
     description: str = "Get financial data for stocks and cryptocurrencies. Use for portfolio updates, market info, or investment tracking."
     args_schema: Type[BaseModel] = FinancialInput
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self, symbols: list, data_type: str = "mixed") -> str:
         """Get financial data."""
         try:
             client = self._get_mcp_client()
-            data = await client.call_tool("financial.get_data", {"symbols": symbols, "data_type": data_type})
+            data = await client.get_financial_data(symbols, data_type)
             
             if 'data' in data:
                 financial_items = data['data']
                 summary = data.get('summary', '')
                 
-                # Format the response
+                # Format the response, with the appropriate emoji for each change
                 result_parts = [f"💰 Financial Update: {summary}"]
+                result_parts.extend(
+                    (_GAIN_LINE if item['change'] >= 0 else _LOSS_LINE).format_map(item)
+                    for item in financial_items
+                )
                 
-                for item in financial_items:
-                    symbol = item['symbol']
-                    name = item['name']
-                    price = item['price']
-                    change = item['change']
-                    change_percent = item['change_percent']
-                    
-                    # Format change with appropriate emoji
-                    if change >= 0:
-                        change_str = f"📈 +${change:.2f} (+{change_percent:.1f}%)"
-                    else:
-                        change_str = f"📉 ${change:.2f} ({change_percent:.1f}%)"
-                    
-                    result_parts.append(f"{symbol} ({name}): ${price:.2f} {change_str}")
-                
-                return "\\n".join(result_parts)
+                return "\n".join(result_parts)
             else:
                 return f"Financial data: {data.get('summary', 'No data available')}"
                 
         except Exception as e:
-            return f"Error getting financial data: {str(e)}"
-    
-    def _run(self, symbols: list, data_type: str = "mixed") -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun(symbols, data_type))
+            return _error_message("getting financial data", e)
 
 
-class MorningBriefingTool(BaseTool):
+class MorningBriefingTool(MCPTool):
     """Tool to get a complete morning briefing."""
     
     name: str = "get_morning_briefing"
     description: str = "Get a complete morning briefing with weather, calendar, todos, and commute. Use when users ask about their day, morning routine, or want a summary."
     
-    def _get_mcp_client(self) -> MCPClient:
-        """Get MCP client instance."""
-        return MCPClient()
-    
     async def _arun(self) -> str:
         """Get complete morning briefing."""
         try:
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = today_str()
             client = self._get_mcp_client()
-            data = await client.get_all_morning_data(today)
             
-            # Get financial data for tracked symbols from config
-            financial_data = await client.call_tool("financial.get_data", {
-                "symbols": FINANCIAL_SYMBOLS,
-                "data_type": "mixed"
+            # Fetch morning data and financial data for tracked symbols concurrently
+            results = await gather_named({
+                "morning": client.get_all_morning_data(today),
+                "financial": client.get_financial_data(get_settings().briefing_symbols, "mixed"),
             })
+            data, financial_data = results["morning"], results["financial"]
+            if isinstance(data, Exception):
+                raise data
+            if isinstance(financial_data, Exception):
+                # Markets are optional in the briefing; don't fail the whole thing
+                logger.warning(f"Financial data unavailable for briefing: {financial_data}")
+                financial_data = None
             
             # Format the briefing
             weather = data.get('weather', {})
@@ -534,6 +552,7 @@ class MorningBriefingTool(BaseTool):
             commute = data.get('commute', {})
             
             briefing_parts = [
+                "Morning Briefing:",
                 f"🌤️ Weather: {weather.get('summary', 'N/A')} - {weather.get('temp_hi', 'N/A')}°F",
                 f"📅 Calendar: {calendar.get('total_events', 0)} events today",
                 f"✅ Todos: {todos.get('pending_count', 0)} pending tasks",
@@ -564,13 +583,13 @@ class MorningBriefingTool(BaseTool):
             if financial_data and 'summary' in financial_data:
                 briefing_parts.append(f"💰 Markets: {financial_data['summary']}")
             
-            return "Morning Briefing:\\n" + "\\n".join(briefing_parts)
+            return "\n".join(briefing_parts)
         except Exception as e:
-            return f"Error getting morning briefing: {str(e)}"
+            return _error_message("getting morning briefing", e)
     
     def _run(self) -> str:
-        """Sync wrapper for async call."""
-        return asyncio.run(self._arun())
+        """Sync wrapper for async call (explicit, since the empty input schema is inferred from it)."""
+        return run_coroutine_sync(self._arun())
 
 
 def get_all_tools():
@@ -587,3 +606,43 @@ def get_all_tools():
         FinancialTool(),
         MorningBriefingTool()
     ]
+
+
+# OpenAI function-calling specs, keyed by tool name (schemas are static per tool)
+_tool_specs: Dict[str, Dict[str, Any]] = {}
+
+# Token cost of each serialized spec, keyed by tool name
+_tool_spec_tokens: Dict[str, int] = {}
+
+
+def get_openai_tool_specs(tools: List[BaseTool]) -> List[Dict[str, Any]]:
+    """
+    Get the OpenAI tool specs for the given tools, converting each tool only once.
+
+    Converting a tool walks its pydantic args schema, so the result is kept
+    for the lifetime of the process.
+    """
+    specs = []
+    for tool in tools:
+        spec = _tool_specs.get(tool.name)
+        if spec is None:
+            spec = convert_to_openai_tool(tool)
+            _tool_specs[tool.name] = spec
+        specs.append(spec)
+    return specs
+
+
+def count_tool_spec_tokens(tools: List[BaseTool]) -> int:
+    """
+    Count the prompt tokens taken up by the given tools' specs.
+
+    Each spec is serialized and tokenized once per process.
+    """
+    total = 0
+    for tool, spec in zip(tools, get_openai_tool_specs(tools)):
+        tokens = _tool_spec_tokens.get(tool.name)
+        if tokens is None:
+            tokens = count_tokens(orjson.dumps(spec).decode())
+            _tool_spec_tokens[tool.name] = tokens
+        total += tokens
+    return total
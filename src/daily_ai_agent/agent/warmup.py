@@ -0,0 +1,41 @@
+"""Warm-up of one-time costs ahead of the first agent turn."""
+
+import time
+from typing import Dict
+
+from loguru import logger
+
+from .orchestrator import get_cached_tools
+from .tools import count_tool_spec_tokens
+from ..utils.tokens import count_tokens
+
+
+def warmup() -> Dict[str, float]:
+    """
+    Pay the agent's one-time startup costs up front instead of on the first turn.
+
+    Loads the tokenizer (tiktoken downloads its encoding file on a fresh
+    machine and serves it from its disk cache afterwards), builds the shared
+    tool instances, and converts and tokenizes their OpenAI specs.
+
+    Returns:
+        Seconds spent on each step
+    """
+    timings: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    count_tokens("warmup")
+    timings["tokenizer"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    tools = get_cached_tools()
+    timings["tools"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    count_tool_spec_tokens(tools)
+    timings["tool_specs"] = time.perf_counter() - started
+
+    logger.info(
+        "Warm-up complete: " + ", ".join(f"{step} {seconds * 1000:.0f}ms" for step, seconds in timings.items())
+    )
+    return timings
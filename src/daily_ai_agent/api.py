@@ -1,17 +1,20 @@
 """Flask API for the AI agent - provides web endpoints for all agent functionality."""
 
 import asyncio
+import decimal
+import hashlib
 import uuid
 import time
-from datetime import datetime
-from flask import Flask, request, jsonify, make_response, g
+import orjson
+from flask import Flask, Response, request, jsonify, make_response, g
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flasgger import Swagger
 from werkzeug.exceptions import BadRequest, InternalServerError
 from loguru import logger
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Coroutine, Optional
 
 from .agent.orchestrator import AgentOrchestrator
 from .services.mcp_client import MCPClient
@@ -22,23 +25,168 @@ from .utils.constants import (
     APP_DESCRIPTION,
     REQUEST_ID_HEADER,
     RATE_LIMIT_HEADERS,
+    FINANCIAL_DATA_TYPES,
 )
 from .utils.error_handlers import handle_api_error, APIError
+from .utils.dates import now_iso, today_str
+from .utils.async_helpers import run_coroutine_sync
+
+
+# Static part of the GET /tools listing, built once rather than per request
+_TOOL_CATALOG: Dict[str, Any] = {
+    "tools": {
+        "weather": {
+            "endpoint": "/tools/weather",
+            "method": "GET",
+            "description": "Get weather forecast",
+            "params": ["location", "when"]
+        },
+        "todos": {
+            "endpoint": "/tools/todos",
+            "method": "GET",
+            "description": "Get todo items",
+            "params": ["bucket", "include_completed"]
+        },
+        "calendar": {
+            "endpoint": "/tools/calendar",
+            "method": "GET",
+            "description": "Get calendar events",
+            "params": ["date"]
+        },
+        "commute": {
+            "endpoint": "/tools/commute",
+            "method": "GET",
+            "description": "Get basic commute information",
+            "params": ["origin", "destination", "mode"]
+        },
+        "commute_options": {
+            "endpoint": "/tools/commute-options",
+            "method": "POST",
+            "description": "Get comprehensive commute analysis with driving vs transit options",
+            "body": ["direction", "departure_time", "include_driving", "include_transit"]
+        },
+        "shuttle": {
+            "endpoint": "/tools/shuttle",
+            "method": "POST",
+            "description": "Get MV Connector shuttle schedule",
+            "body": ["origin", "destination", "departure_time"]
+        },
+        "financial": {
+            "endpoint": "/tools/financial",
+            "method": "POST",
+            "description": "Get real-time stock and crypto prices",
+            "params": ["symbols", "data_type"]
+        }
+    },
+    "ai_features": {
+        "chat": {
+            "endpoint": "/chat",
+            "method": "POST",
+            "description": "Natural language conversation",
+            "body": {"message": "string"}
+        },
+        "briefing": {
+            "endpoint": "/briefing",
+            "method": "GET",
+            "description": "Morning briefing (basic or smart)",
+            "params": ["type"]
+        }
+    },
+    "system": {
+        "health": {
+            "endpoint": "/health",
+            "method": "GET",
+            "description": "Health check"
+        },
+        "version": {
+            "endpoint": "/version",
+            "method": "GET",
+            "description": "Version information"
+        }
+    },
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the types orjson doesn't handle natively, as Flask's provider does."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify and request.get_json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response straight from orjson's bytes."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype="application/json")
+
+
+def _tool_response(tool: str, data: Any) -> Response:
+    """
+    Build the JSON response for a GET tool endpoint, honouring If-None-Match.
+
+    The timestamp and request ID differ on every response, so the (weak) ETag
+    covers only the tool data: a client polling an unchanged result gets a
+    bodyless 304 instead of the full payload.
+    """
+    response = jsonify({
+        "tool": tool,
+        "data": data,
+        "timestamp": now_iso(),
+        "request_id": g.get('request_id', 'unknown'),
+    })
+    digest = hashlib.blake2b(
+        orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+        digest_size=8,
+    )
+    response.set_etag(digest.hexdigest(), weak=True)
+    return response.make_conditional(request)
+
+
+class AgentFlask(Flask):
+    """
+    Flask app whose async views all run on the shared background event loop.
+
+    Flask's default runs each async view on a throwaway loop, so pooled MCP
+    connections and in-flight request coalescing never outlive a request.
+    Responses are serialized with orjson.
+    """
+
+    json_provider_class = ORJSONProvider
+
+    def async_to_sync(self, func: Callable[..., Coroutine]) -> Callable[..., Any]:
+        """Wrap an async view so it runs on the background loop."""
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return run_coroutine_sync(func(*args, **kwargs))
+
+        return wrapper
 
 
 def create_app(testing: bool = False) -> Flask:
     """Create and configure the Flask application."""
-    app = Flask(__name__)
+    app = AgentFlask(__name__)
     settings = get_settings()
 
     # Configure CORS
     CORS(app, origins=settings.allowed_origins)
 
-    # Configure rate limiting
+    # Configure rate limiting (in-process counters; the API runs as a single process)
     limiter = Limiter(
         app=app,
         key_func=get_remote_address,
-        default_limits=[f"{settings.rate_limit_per_minute} per minute"]
+        default_limits=[f"{settings.rate_limit_per_minute} per minute"],
+        storage_uri="memory://",
     )
 
     # Configure Swagger UI
@@ -140,6 +288,7 @@ def create_app(testing: bool = False) -> Flask:
     # ==================== System Endpoints ====================
 
     @app.route('/health', methods=['GET'])
+    @limiter.exempt
     def health_check():
         """Health check endpoint.
         ---
@@ -171,13 +320,14 @@ def create_app(testing: bool = False) -> Flask:
             "status": "healthy",
             "service": APP_NAME,
             "version": APP_VERSION,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "mcp_server": settings.mcp_server_url,
             "ai_enabled": orchestrator.is_conversational(),
             "request_id": g.get('request_id', 'unknown'),
         })
 
     @app.route('/version', methods=['GET'])
+    @limiter.exempt
     def get_version():
         """Get API version information.
         ---
@@ -204,7 +354,7 @@ def create_app(testing: bool = False) -> Flask:
             "name": APP_NAME,
             "description": APP_DESCRIPTION,
             "environment": settings.environment,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         })
 
     # ==================== AI Features ====================
@@ -248,8 +398,10 @@ def create_app(testing: bool = False) -> Flask:
         """
         try:
             data = request.get_json()
-            if not data or 'message' not in data:
+            if not isinstance(data, dict) or 'message' not in data:
                 raise BadRequest("Missing 'message' field in request body")
+            if not isinstance(data['message'], str):
+                raise BadRequest("'message' must be a string")
 
             message = data['message'].strip()
             if not message:
@@ -267,7 +419,7 @@ def create_app(testing: bool = False) -> Flask:
 
             return jsonify({
                 "response": response,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "request_id": g.get('request_id', 'unknown'),
             })
 
@@ -328,19 +480,19 @@ def create_app(testing: bool = False) -> Flask:
                 return jsonify({
                     "type": "smart",
                     "briefing": briefing_text,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso(),
                     "request_id": g.get('request_id', 'unknown'),
                 })
 
             else:  # Basic briefing
                 logger.info(f"[{g.request_id}] Generating basic briefing")
-                today = datetime.now().strftime('%Y-%m-%d')
+                today = today_str()
                 data = await mcp_client.get_all_morning_data(today)
 
                 return jsonify({
                     "type": "basic",
                     "data": data,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso(),
                     "request_id": g.get('request_id', 'unknown'),
                 })
 
@@ -383,12 +535,7 @@ def create_app(testing: bool = False) -> Flask:
             logger.info(f"[{g.request_id}] Weather request: {location}, {when}")
             weather_data = await mcp_client.get_weather(location, when)
 
-            return jsonify({
-                "tool": "weather",
-                "data": weather_data,
-                "timestamp": datetime.now().isoformat(),
-                "request_id": g.get('request_id', 'unknown'),
-            })
+            return _tool_response("weather", weather_data)
 
         except Exception as e:
             logger.error(f"[{g.request_id}] Weather error: {e}")
@@ -408,12 +555,7 @@ def create_app(testing: bool = False) -> Flask:
             logger.info(f"[{g.request_id}] Todos request: {bucket_label}, include_completed={include_completed}")
             todos_data = await mcp_client.get_todos(bucket, include_completed)
 
-            return jsonify({
-                "tool": "todos",
-                "data": todos_data,
-                "timestamp": datetime.now().isoformat(),
-                "request_id": g.get('request_id', 'unknown'),
-            })
+            return _tool_response("todos", todos_data)
 
         except Exception as e:
             logger.error(f"[{g.request_id}] Todos error: {e}")
@@ -426,17 +568,12 @@ def create_app(testing: bool = False) -> Flask:
     async def get_calendar():
         """Get calendar events."""
         try:
-            date = request.args.get('date', datetime.now().strftime('%Y-%m-%d'))
+            date = request.args.get('date') or today_str()
 
             logger.info(f"[{g.request_id}] Calendar request: {date}")
             calendar_data = await mcp_client.get_calendar_events(date)
 
-            return jsonify({
-                "tool": "calendar",
-                "data": calendar_data,
-                "timestamp": datetime.now().isoformat(),
-                "request_id": g.get('request_id', 'unknown'),
-            })
+            return _tool_response("calendar", calendar_data)
 
         except Exception as e:
             logger.error(f"[{g.request_id}] Calendar error: {e}")
@@ -456,12 +593,7 @@ def create_app(testing: bool = False) -> Flask:
             logger.info(f"[{g.request_id}] Commute request: {origin} -> {destination} ({mode})")
             commute_data = await mcp_client.get_commute(origin, destination, mode)
 
-            return jsonify({
-                "tool": "commute",
-                "data": commute_data,
-                "timestamp": datetime.now().isoformat(),
-                "request_id": g.get('request_id', 'unknown'),
-            })
+            return _tool_response("commute", commute_data)
 
         except Exception as e:
             logger.error(f"[{g.request_id}] Commute error: {e}")
@@ -488,7 +620,7 @@ def create_app(testing: bool = False) -> Flask:
             return jsonify({
                 "tool": "commute_options",
                 "data": commute_data,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "request_id": g.get('request_id', 'unknown'),
             })
 
@@ -520,7 +652,7 @@ def create_app(testing: bool = False) -> Flask:
             return jsonify({
                 "tool": "shuttle",
                 "data": shuttle_data,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "request_id": g.get('request_id', 'unknown'),
             })
 
@@ -536,7 +668,7 @@ def create_app(testing: bool = False) -> Flask:
         """Get real-time stock and cryptocurrency market data."""
         try:
             data = request.get_json()
-            if not data or 'symbols' not in data:
+            if not isinstance(data, dict) or 'symbols' not in data:
                 return jsonify({
                     "error": "Missing 'symbols' field in request body",
                     "request_id": g.get('request_id', 'unknown'),
@@ -545,22 +677,25 @@ def create_app(testing: bool = False) -> Flask:
             symbols = data['symbols']
             data_type = data.get('data_type', 'mixed')
 
-            if not isinstance(symbols, list) or not symbols:
+            if not isinstance(symbols, list) or not symbols or not all(isinstance(s, str) for s in symbols):
+                return jsonify({
+                    "error": "'symbols' must be a non-empty array of strings",
+                    "request_id": g.get('request_id', 'unknown'),
+                }), 400
+
+            if data_type not in FINANCIAL_DATA_TYPES:
                 return jsonify({
-                    "error": "'symbols' must be a non-empty array",
+                    "error": f"'data_type' must be one of: {', '.join(FINANCIAL_DATA_TYPES)}",
                     "request_id": g.get('request_id', 'unknown'),
                 }), 400
 
             logger.info(f"[{g.request_id}] Financial request: {symbols} ({data_type})")
-            financial_data = await mcp_client.call_tool("financial.get_data", {
-                "symbols": symbols,
-                "data_type": data_type
-            })
+            financial_data = await mcp_client.get_financial_data(symbols, data_type)
 
             return jsonify({
                 "tool": "financial",
                 "data": financial_data,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "request_id": g.get('request_id', 'unknown'),
             })
 
@@ -572,82 +707,14 @@ def create_app(testing: bool = False) -> Flask:
             }), 500
 
     @app.route('/tools', methods=['GET'])
+    @limiter.exempt
     def list_tools():
         """List all available tools and their endpoints."""
         return jsonify({
-            "tools": {
-                "weather": {
-                    "endpoint": "/tools/weather",
-                    "method": "GET",
-                    "description": "Get weather forecast",
-                    "params": ["location", "when"]
-                },
-                "todos": {
-                    "endpoint": "/tools/todos",
-                    "method": "GET",
-                    "description": "Get todo items",
-                    "params": ["bucket", "include_completed"]
-                },
-                "calendar": {
-                    "endpoint": "/tools/calendar",
-                    "method": "GET",
-                    "description": "Get calendar events",
-                    "params": ["date"]
-                },
-                "commute": {
-                    "endpoint": "/tools/commute",
-                    "method": "GET",
-                    "description": "Get basic commute information",
-                    "params": ["origin", "destination", "mode"]
-                },
-                "commute_options": {
-                    "endpoint": "/tools/commute-options",
-                    "method": "POST",
-                    "description": "Get comprehensive commute analysis with driving vs transit options",
-                    "body": ["direction", "departure_time", "include_driving", "include_transit"]
-                },
-                "shuttle": {
-                    "endpoint": "/tools/shuttle",
-                    "method": "POST",
-                    "description": "Get MV Connector shuttle schedule",
-                    "body": ["origin", "destination", "departure_time"]
-                },
-                "financial": {
-                    "endpoint": "/tools/financial",
-                    "method": "POST",
-                    "description": "Get real-time stock and crypto prices",
-                    "params": ["symbols", "data_type"]
-                }
-            },
-            "ai_features": {
-                "chat": {
-                    "endpoint": "/chat",
-                    "method": "POST",
-                    "description": "Natural language conversation",
-                    "body": {"message": "string"}
-                },
-                "briefing": {
-                    "endpoint": "/briefing",
-                    "method": "GET",
-                    "description": "Morning briefing (basic or smart)",
-                    "params": ["type"]
-                }
-            },
-            "system": {
-                "health": {
-                    "endpoint": "/health",
-                    "method": "GET",
-                    "description": "Health check"
-                },
-                "version": {
-                    "endpoint": "/version",
-                    "method": "GET",
-                    "description": "Version information"
-                }
-            },
+            **_TOOL_CATALOG,
             "version": APP_VERSION,
             "available": orchestrator.is_conversational(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "request_id": g.get('request_id', 'unknown'),
         })
 
@@ -3,12 +3,14 @@
 import os
 import sys
 from pathlib import Path
+from loguru import logger
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from .api import create_app
+from .agent.warmup import warmup
 from .models.config import get_settings
 
 
@@ -24,9 +26,17 @@ def main():
         except ImportError:
             print("python-dotenv not installed, skipping .env file loading")
     
+    settings = get_settings()
+
+    # Write logs from a background thread so sinks never block request handling
+    logger.remove()
+    logger.add(sys.stderr, level=settings.log_level, enqueue=True)
+
+    # Load the tokenizer and tool specs now rather than on the first request
+    warmup()
+
     # Create the Flask app
     app = create_app()
-    settings = get_settings()
     
     print(f"🚀 Starting AI Agent API Server")
     print(f"📊 Environment: {settings.environment}")
@@ -2,15 +2,16 @@
 
 import asyncio
 import typer
-from datetime import datetime
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from loguru import logger
 
 from .services.mcp_client import MCPClient
 from .models.config import get_settings
-from .agent.orchestrator import AgentOrchestrator
+from .utils.dates import today_str
+from .utils.async_helpers import new_event_loop
 
 app = typer.Typer(help="🤖 Morning Routine AI Agent")
 console = Console()
@@ -28,7 +29,7 @@ def health():
         else:
             console.print("❌ MCP Server is not responding", style="red")
     
-    asyncio.run(check())
+    asyncio.run(check(), loop_factory=new_event_loop)
 
 
 @app.command()
@@ -59,7 +60,7 @@ def weather(location: str = None):
         except Exception as e:
             console.print(f"❌ Error getting weather: {e}", style="red")
     
-    asyncio.run(get_weather())
+    asyncio.run(get_weather(), loop_factory=new_event_loop)
 
 
 @app.command()
@@ -89,7 +90,7 @@ def todos(bucket: str = "work"):
         except Exception as e:
             console.print(f"❌ Error getting todos: {e}", style="red")
     
-    asyncio.run(get_todos())
+    asyncio.run(get_todos(), loop_factory=new_event_loop)
 
 
 @app.command()
@@ -121,7 +122,7 @@ def commute(origin: str = None, destination: str = None):
         except Exception as e:
             console.print(f"❌ Error getting commute: {e}", style="red")
     
-    asyncio.run(get_commute())
+    asyncio.run(get_commute(), loop_factory=new_event_loop)
 
 
 @app.command()
@@ -129,7 +130,7 @@ def briefing(date: str = None):
     """Generate a complete morning briefing."""
     async def generate_briefing():
         client = MCPClient()
-        target_date = date or datetime.now().strftime('%Y-%m-%d')
+        target_date = date or today_str()
         
         console.print(f"🌅 Generating morning briefing for {target_date}...")
         
@@ -155,14 +156,16 @@ def briefing(date: str = None):
         except Exception as e:
             console.print(f"❌ Error generating briefing: {e}", style="red")
     
-    asyncio.run(generate_briefing())
+    asyncio.run(generate_briefing(), loop_factory=new_event_loop)
 
 
 @app.command()
 def chat(message: str = typer.Option(None, "--message", "-m", help="Single message to send to the assistant")):
     """Have a natural language conversation with your AI assistant."""
     async def chat_session():
-        orchestrator = AgentOrchestrator()
+        # Imported lazily so non-conversational commands don't load LangChain
+        from .agent.orchestrator import get_orchestrator
+        orchestrator = get_orchestrator()
         
         if not orchestrator.is_conversational():
             console.print("❌ Conversational features require an OpenAI API key in your .env file", style="red")
@@ -207,7 +210,7 @@ def chat(message: str = typer.Option(None, "--message", "-m", help="Single messa
                 except Exception as e:
                     console.print(f"❌ Error: {e}", style="red")
     
-    asyncio.run(chat_session())
+    asyncio.run(chat_session(), loop_factory=new_event_loop)
 
 
 @app.command("smart-briefing")
@@ -216,25 +219,81 @@ def smart_briefing():
     async def generate_smart_briefing():
         console.print("🤖 Generating your intelligent morning briefing...", style="blue")
         
-        orchestrator = AgentOrchestrator()
+        from .agent.orchestrator import get_orchestrator
+        orchestrator = get_orchestrator()
         
         try:
-            briefing = await orchestrator.get_smart_briefing()
-            
-            # Display in a beautiful panel
-            briefing_panel = Panel.fit(
-                briefing,
-                title="🌅 AI Morning Briefing",
-                border_style="green"
-            )
-            
-            console.print(briefing_panel)
+            # Display in a beautiful panel, filled in as the briefing streams
+            briefing = ""
+            with Live(console=console, refresh_per_second=10) as live:
+                async for chunk in orchestrator.stream_smart_briefing():
+                    briefing += chunk
+                    live.update(Panel.fit(
+                        briefing,
+                        title="🌅 AI Morning Briefing",
+                        border_style="green"
+                    ))
             
         except Exception as e:
             console.print(f"❌ Error generating smart briefing: {e}", style="red")
             console.print("💡 Try the regular 'briefing' command or check your OpenAI API key", style="yellow")
     
-    asyncio.run(generate_smart_briefing())
+    asyncio.run(generate_smart_briefing(), loop_factory=new_event_loop)
+
+
+@app.command("schedule-briefing")
+def schedule_briefing(
+    collect: str = typer.Option(None, "--collect", "-c", help="Batch ID to collect a finished briefing from"),
+):
+    """Queue today's briefing on the OpenAI Batch API (half price), or collect a queued one."""
+    async def run_batch():
+        from .agent.orchestrator import get_orchestrator
+        orchestrator = get_orchestrator()
+        
+        try:
+            if collect:
+                briefing = await orchestrator.collect_briefing_batch(collect)
+                if briefing is None:
+                    console.print(f"⏳ Batch {collect} is still running, try again later", style="yellow")
+                    return
+                
+                console.print(Panel.fit(
+                    briefing,
+                    title="🌅 AI Morning Briefing",
+                    border_style="green"
+                ))
+            else:
+                batch_id = await orchestrator.submit_briefing_batch()
+                console.print(f"📬 Briefing queued as batch {batch_id}", style="green")
+                console.print(f"💡 Collect it with: daily-ai-agent schedule-briefing --collect {batch_id}", style="dim")
+        
+        except Exception as e:
+            console.print(f"❌ Error with batch briefing: {e}", style="red")
+    
+    asyncio.run(run_batch(), loop_factory=new_event_loop)
+
+
+@app.command()
+def warmup():
+    """Pay one-time startup costs (tokenizer, tools, specs) and check the MCP server."""
+    from .agent.warmup import warmup as run_warmup
+    
+    timings = run_warmup()
+    
+    table = Table(title="🔥 Warm-up")
+    table.add_column("Step", style="cyan")
+    table.add_column("Time", style="magenta")
+    for step, seconds in timings.items():
+        table.add_row(step, f"{seconds * 1000:.0f} ms")
+    console.print(table)
+    
+    async def check():
+        return await MCPClient().health_check()
+    
+    if asyncio.run(check(), loop_factory=new_event_loop):
+        console.print("✅ MCP Server is healthy!", style="green")
+    else:
+        console.print("❌ MCP Server is not responding", style="red")
 
 
 @app.command()
@@ -286,7 +345,7 @@ def demo():
         console.print("  • uv run daily-ai-agent chat", style="cyan")
         console.print("  • uv run daily-ai-agent smart-briefing", style="cyan")
     
-    asyncio.run(run_demo())
+    asyncio.run(run_demo(), loop_factory=new_event_loop)
 
 
 def main():
@@ -2,9 +2,11 @@
 
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import os
 
+from ..utils.constants import FINANCIAL_SYMBOLS
+
 
 # Default CORS origins for development
 DEFAULT_CORS_ORIGINS = [
@@ -32,10 +34,15 @@ class Settings(BaseSettings):
     # MCP Server Connection
     mcp_server_url: str = "http://localhost:8000"
     mcp_server_timeout: int = 45
+    mcp_max_concurrency: int = 8
 
     # Agent Configuration
     log_level: str = "INFO"
     enable_memory: bool = True
+    max_history_turns: int = 10
+    max_context_tokens: int = 16000
+    max_concurrency: int = 5
+    llm_cache_ttl_seconds: int = 300
     debug: bool = False
     environment: str = "development"
 
@@ -53,12 +60,16 @@ class Settings(BaseSettings):
     default_commute_origin: str = "Home"
     default_commute_destination: str = "Office"
 
+    # Morning briefing market symbols - can be set via BRIEFING_SYMBOLS env var (comma-separated)
+    briefing_symbols_env: Optional[str] = None
+
     class Config:
         env_file = ".env"
         case_sensitive = False
         # Map environment variables to field names
         fields = {
             "allowed_origins_env": {"env": "ALLOWED_ORIGINS"},
+            "briefing_symbols_env": {"env": "BRIEFING_SYMBOLS"},
         }
 
     @property
@@ -84,6 +95,23 @@ class Settings(BaseSettings):
             return PRODUCTION_CORS_ORIGINS + DEFAULT_CORS_ORIGINS
         return DEFAULT_CORS_ORIGINS
 
+    @property
+    def briefing_symbols(self) -> Tuple[str, ...]:
+        """
+        Get the symbols tracked in the morning briefing.
+
+        Uses BRIEFING_SYMBOLS (comma-separated) when set, otherwise FINANCIAL_SYMBOLS.
+        """
+        if self.briefing_symbols_env:
+            symbols = tuple(
+                symbol.strip()
+                for symbol in self.briefing_symbols_env.split(",")
+                if symbol.strip()
+            )
+            if symbols:
+                return symbols
+        return FINANCIAL_SYMBOLS
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -111,6 +139,8 @@ class Settings(BaseSettings):
             kwargs["port"] = int(os.getenv("PORT", "8001"))
         if "allowed_origins_env" not in kwargs:
             kwargs["allowed_origins_env"] = os.getenv("ALLOWED_ORIGINS")
+        if "briefing_symbols_env" not in kwargs:
+            kwargs["briefing_symbols_env"] = os.getenv("BRIEFING_SYMBOLS")
 
         super().__init__(**kwargs)
 
@@ -2,24 +2,38 @@
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterator, Optional
 from loguru import logger
+import orjson
 
 from ..models.config import get_settings
+from ..utils.constants import DEFAULT_LLM_MODEL, DEFAULT_LLM_TEMPERATURE, BATCH_COMPLETION_WINDOW
+from ..utils.error_handlers import APIError
+
+# Chat Completions roles for LangChain message types
+OPENAI_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
 
 
 class LLMService:
     """Service for interacting with Large Language Models."""
     
-    def __init__(self):
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
+        """
+        Initialize the LLM service.
+        
+        Args:
+            llm: Existing chat model to reuse (avoids building a second OpenAI client)
+        """
         self.settings = get_settings()
         
         # Initialize OpenAI client
-        if self.settings.openai_api_key:
+        if llm is not None:
+            self.llm = llm
+        elif self.settings.openai_api_key:
             self.llm = ChatOpenAI(
                 api_key=self.settings.openai_api_key,
-                model="gpt-4o-mini",  # Fast and cost-effective
-                temperature=0.1  # Low temperature for consistent responses
+                model=DEFAULT_LLM_MODEL,  # Fast and cost-effective
+                temperature=DEFAULT_LLM_TEMPERATURE  # Low temperature for consistent responses
             )
         else:
             self.llm = None
@@ -42,6 +56,143 @@ class LLMService:
         if not self.is_available():
             return self._fallback_briefing(data)
         
+        try:
+            response = await self.llm.ainvoke(self._briefing_messages(data))
+            return response.content.strip()
+            
+        except Exception as e:
+            logger.error(f"Error generating briefing: {e}")
+            return self._fallback_briefing(data)
+    
+    async def stream_morning_briefing(self, data: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream a natural language morning briefing as it is generated.
+        
+        Args:
+            data: Combined data from all morning tools
+            
+        Yields:
+            Briefing text chunks
+        """
+        if not self.is_available():
+            yield self._fallback_briefing(data)
+            return
+        
+        streamed_any = False
+        try:
+            async for chunk in self.llm.astream(self._briefing_messages(data)):
+                if chunk.content:
+                    streamed_any = True
+                    yield chunk.content
+                    
+        except Exception as e:
+            logger.error(f"Error streaming briefing: {e}")
+            if not streamed_any:
+                yield self._fallback_briefing(data)
+    
+    async def submit_briefing_batch(self, data: Dict[str, Any], custom_id: str) -> str:
+        """
+        Submit a morning briefing through the OpenAI Batch API.
+        
+        Batch requests cost half as much as synchronous ones and complete
+        within the completion window, which suits scheduled briefings that
+        are generated well before they are read.
+        
+        Args:
+            data: Combined data from all morning tools
+            custom_id: Identifier for the request inside the batch
+            
+        Returns:
+            OpenAI batch ID to collect the result with
+            
+        Raises:
+            APIError: If no OpenAI API key is configured
+        """
+        if not self.is_available():
+            raise APIError("Batch briefings require an OpenAI API key", status_code=503)
+        
+        request = {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.llm.model_name,
+                "temperature": self.llm.temperature,
+                "messages": [
+                    {"role": OPENAI_ROLES[message.type], "content": message.content}
+                    for message in self._briefing_messages(data)
+                ],
+            },
+        }
+        
+        # Reuse the chat model's OpenAI client (and its connection pool)
+        client = self.llm.root_async_client
+        batch_file = await client.files.create(
+            file=("briefing.jsonl", orjson.dumps(request) + b"\n"),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        logger.info(f"Submitted briefing batch {batch.id}")
+        return batch.id
+    
+    async def collect_briefing_batch(self, batch_id: str) -> Optional[str]:
+        """
+        Get the briefing produced by a batch, if it has finished.
+        
+        Args:
+            batch_id: ID returned by submit_briefing_batch
+            
+        Returns:
+            Briefing text, or None if the batch is still running
+            
+        Raises:
+            APIError: If no OpenAI API key is configured or the batch failed
+        """
+        if not self.is_available():
+            raise APIError("Batch briefings require an OpenAI API key", status_code=503)
+        
+        client = self.llm.root_async_client
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status in ("validating", "in_progress", "finalizing", "cancelling"):
+            return None
+        # A completed batch whose request failed only has an error file
+        if batch.status == "completed" and not batch.output_file_id and batch.error_file_id:
+            result = await self._read_batch_result(batch.error_file_id)
+            raise APIError(f"Briefing batch {batch_id} failed: {self._batch_result_error(result) or 'unknown error'}")
+        if batch.status != "completed" or not batch.output_file_id:
+            raise APIError(f"Briefing batch {batch_id} ended with status '{batch.status}'")
+        
+        result = await self._read_batch_result(batch.output_file_id)
+        error = self._batch_result_error(result)
+        if error:
+            raise APIError(f"Briefing batch {batch_id} failed: {error}")
+        return result["response"]["body"]["choices"][0]["message"]["content"].strip()
+    
+    async def _read_batch_result(self, file_id: str) -> Dict[str, Any]:
+        """Read the (single) result line from a batch output or error file."""
+        output = await self.llm.root_async_client.files.content(file_id)
+        return orjson.loads(output.content.splitlines()[0])
+    
+    @staticmethod
+    def _batch_result_error(result: Dict[str, Any]) -> Optional[str]:
+        """Describe why a batch result line failed, or None if it succeeded."""
+        error = result.get("error")
+        if error:
+            return error.get("message") or str(error)
+        response = result.get("response")
+        if not response:
+            return "no response returned"
+        if response.get("status_code") != 200:
+            body_error = (response.get("body") or {}).get("error") or {}
+            return body_error.get("message") or f"request returned status {response.get('status_code')}"
+        return None
+    
+    def _briefing_messages(self, data: Dict[str, Any]) -> List[Any]:
+        """Build the LLM messages for a morning briefing."""
         # Extract key information
         weather = data.get('weather', {})
         calendar = data.get('calendar', {})
@@ -61,18 +212,10 @@ Generate a friendly, concise morning briefing that highlights the most important
 Be conversational but informative. Focus on actionable insights.
 User location: {self.settings.user_location}"""
         
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=f"Here's my morning data:\n{context}\n\nGenerate my morning briefing:")
-            ]
-            
-            response = await self.llm.ainvoke(messages)
-            return response.content.strip()
-            
-        except Exception as e:
-            logger.error(f"Error generating briefing: {e}")
-            return self._fallback_briefing(data)
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=f"Here's my morning data:\n{context}\n\nGenerate my morning briefing:")
+        ]
     
     async def chat_response(self, user_message: str, context: Dict[str, Any] = None) -> str:
         """
@@ -96,7 +239,7 @@ Current time context: Morning routine assistant"""
         
         context_text = ""
         if context:
-            context_text = f"\\n\\nCurrent data: {context}"
+            context_text = f"\n\nCurrent data: {context}"
         
         try:
             messages = [
@@ -129,4 +272,4 @@ Current time context: Morning routine assistant"""
             "Have a great day! 🚀"
         ]
         
-        return "\\n".join(briefing_parts)
+        return "\n".join(briefing_parts)
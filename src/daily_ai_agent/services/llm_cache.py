@@ -0,0 +1,137 @@
+"""Exact-match response cache for LLM agent calls."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+import orjson
+from loguru import logger
+
+from ..models.config import get_settings
+from ..utils.async_helpers import SingleFlight
+from ..utils.constants import LLM_CACHE_MAX_ENTRIES
+
+
+class LLMCache:
+    """
+    In-memory TTL cache for agent responses, keyed by a hash of the request.
+
+    With low-temperature models, identical inputs (same model, prompt, tools,
+    history and date) produce effectively identical answers, so a hit can skip
+    the LLM and tool round trips entirely. Entries expire after ``ttl_seconds``
+    so live data such as weather and traffic is refreshed regularly.
+    Identical requests that arrive while the first is still running wait for
+    its answer rather than making their own LLM call.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = LLM_CACHE_MAX_ENTRIES) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._in_flight = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if caching is enabled (a TTL of 0 disables it)."""
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a stable cache key from the request parts."""
+        payload = orjson.dumps(parts, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def normalize_input(text: str) -> str:
+        """
+        Normalize user text for cache keys.
+
+        Case, runs of whitespace and trailing punctuation don't change what is
+        being asked, so "What's the weather?" and "what's the  weather" share
+        an entry. Anything beyond that (synonyms, paraphrases) is left to the
+        model, since near-identical wording can ask about a different day.
+        """
+        return " ".join(text.casefold().split()).rstrip("?!. ")
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        logger.debug("LLM cache hit")
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Tuple[str, bool]]],
+    ) -> str:
+        """
+        Get a cached response, or compute and cache it.
+
+        Concurrent misses for the same key on one event loop share a single
+        computation, even when caching is disabled. A computed response is
+        only stored when ``compute`` marks it cacheable, so answers from
+        writes or failed tool calls are never replayed.
+
+        Args:
+            key: Cache key from make_key
+            compute: Zero-argument coroutine function producing the response
+                and whether it may be cached
+
+        Returns:
+            The cached or freshly computed response
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        async def compute_and_store() -> str:
+            value, cacheable = await compute()
+            if cacheable:
+                self.set(key, value)
+            return value
+
+        return await self._in_flight.do(key, compute_and_store)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache instance (lazy initialization)
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the global LLM response cache."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMCache(ttl_seconds=get_settings().llm_cache_ttl_seconds)
+    return _llm_cache
+
+
+def reset_llm_cache() -> None:
+    """Reset the global LLM response cache (useful for testing)."""
+    global _llm_cache
+    _llm_cache = None
@@ -1,8 +1,14 @@
 """HTTP client for communicating with the deployed MCP server."""
 
+import atexit
 import httpx
 import asyncio
-from typing import Dict, Any, Optional, ClassVar
+import importlib.util
+import orjson
+import threading
+import time
+import weakref
+from typing import Dict, Any, Iterable, Optional, ClassVar
 from loguru import logger
 from contextlib import asynccontextmanager
 
@@ -13,16 +19,52 @@ from ..utils.constants import (
     RETRY_MAX_DELAY,
     RETRY_EXPONENTIAL_BASE,
     HEALTH_CHECK_TIMEOUT,
+    MCP_CACHE_TTLS,
+    MCP_CACHE_MAX_ENTRIES,
+    MCP_FAILURE_THRESHOLD,
+    MCP_FAILURE_WINDOW_SECONDS,
+    MCP_STALE_IF_ERROR_SECONDS,
+)
+from ..utils.async_helpers import (
+    AsyncTTLCache,
+    background_loop_running,
+    gather_named,
+    run_coroutine_sync,
 )
 from ..utils.error_handlers import MCPError
 
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); HTTP/1.1 keep-alive is used otherwise
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
 class MCPClient:
     """HTTP client for calling MCP server tools with connection pooling and retry logic."""
 
-    # Class-level connection pool for reuse across instances
-    _client: ClassVar[Optional[httpx.AsyncClient]] = None
-    _client_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    # Class-level connection pools for reuse across instances, one per event loop:
+    # pooled connections belong to the loop that opened them, and the CLI's loop
+    # differs from the background loop shared by the API and sync tool wrappers
+    _clients: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"] = (
+        weakref.WeakKeyDictionary()
+    )
+    _clients_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Per-event-loop semaphores bounding in-flight requests to the MCP server
+    _semaphores: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    # Class-level response caches for read-only tools, one per tool name
+    _response_caches: ClassVar[Dict[str, AsyncTTLCache]] = {
+        tool_name: AsyncTTLCache(
+            ttl_seconds=ttl,
+            max_entries=MCP_CACHE_MAX_ENTRIES,
+            failure_threshold=MCP_FAILURE_THRESHOLD,
+            failure_window_seconds=MCP_FAILURE_WINDOW_SECONDS,
+            stale_if_error_seconds=MCP_STALE_IF_ERROR_SECONDS,
+        )
+        for tool_name, ttl in MCP_CACHE_TTLS.items()
+    }
 
     def __init__(self) -> None:
         self.settings = get_settings()
@@ -32,7 +74,7 @@ class MCPClient:
     @classmethod
     async def get_client(cls, timeout: int = 45) -> httpx.AsyncClient:
         """
-        Get or create the shared HTTP client with connection pooling.
+        Get or create the shared HTTP client for the running event loop.
 
         Args:
             timeout: Request timeout in seconds
@@ -40,9 +82,11 @@ class MCPClient:
         Returns:
             Shared AsyncClient instance
         """
-        async with cls._client_lock:
-            if cls._client is None or cls._client.is_closed:
-                cls._client = httpx.AsyncClient(
+        loop = asyncio.get_running_loop()
+        with cls._clients_lock:
+            client = cls._clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
                     timeout=httpx.Timeout(timeout),
                     limits=httpx.Limits(
                         max_connections=100,
@@ -50,18 +94,29 @@ class MCPClient:
                         keepalive_expiry=30.0,
                     ),
                     headers={"Content-Type": "application/json"},
+                    http2=HTTP2_AVAILABLE,
                 )
+                cls._clients[loop] = client
                 logger.debug("Created new HTTP client with connection pooling")
-            return cls._client
+            return client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the request semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.settings.mcp_max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
 
     @classmethod
     async def close_client(cls) -> None:
-        """Close the shared HTTP client."""
-        async with cls._client_lock:
-            if cls._client is not None and not cls._client.is_closed:
-                await cls._client.aclose()
-                cls._client = None
-                logger.debug("Closed HTTP client")
+        """Close the shared HTTP client for the running event loop."""
+        with cls._clients_lock:
+            client = cls._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+            logger.debug("Closed HTTP client")
 
     async def _request_with_retry(
         self,
@@ -89,31 +144,38 @@ class MCPClient:
         delay = RETRY_BASE_DELAY
 
         client = await self.get_client(self.timeout)
+        semaphore = self._get_semaphore()
 
         for attempt in range(max_retries + 1):
             try:
-                if method.upper() == "GET":
-                    response = await client.get(url)
-                else:
-                    response = await client.post(url, json=json_data)
+                # Bound concurrent requests so parallel tool calls can't swamp the server
+                async with semaphore:
+                    if method.upper() == "GET":
+                        response = await client.get(url)
+                    else:
+                        # orjson is several times faster than stdlib json for these payloads
+                        response = await client.post(url, content=orjson.dumps(json_data))
 
                 response.raise_for_status()
                 return response
 
             except httpx.HTTPStatusError as e:
-                # Don't retry client errors (4xx)
-                if 400 <= e.response.status_code < 500:
+                # Don't retry client errors (4xx), except rate limiting
+                status_code = e.response.status_code
+                if 400 <= status_code < 500 and status_code != 429:
                     raise MCPError(
-                        f"HTTP {e.response.status_code}: {e.response.text}",
-                        status_code=e.response.status_code,
+                        f"HTTP {status_code}: {e.response.text}",
+                        status_code=status_code,
                     )
                 last_exception = e
 
-            except (httpx.TimeoutException, httpx.ConnectError) as e:
+            except httpx.TransportError as e:
+                # Timeouts, refused connections, dropped connections
                 last_exception = e
 
             except Exception as e:
-                last_exception = e
+                # Not a network failure; retrying won't help
+                raise MCPError(f"Request failed: {e}")
 
             # Retry logic
             if attempt < max_retries:
@@ -126,12 +188,32 @@ class MCPClient:
             else:
                 logger.error(f"All {max_retries + 1} attempts failed: {last_exception}")
 
-        raise MCPError(f"Request failed after {max_retries + 1} attempts: {last_exception}")
+        raise MCPError(
+            f"Request failed after {max_retries + 1} attempts: {last_exception}",
+            retriable=True,
+        )
+
+    @classmethod
+    def clear_cache(cls, prefix: str = "") -> None:
+        """
+        Clear cached tool responses.
+
+        Args:
+            prefix: Only clear tools whose name starts with this (e.g. 'calendar.')
+        """
+        for tool_name, cache in cls._response_caches.items():
+            if tool_name.startswith(prefix):
+                cache.clear()
 
     async def call_tool(self, tool_name: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call a specific tool on the MCP server.
 
+        Identical concurrent calls to read-only tools listed in MCP_CACHE_TTLS
+        share one request, and their responses are cached for the tool's TTL.
+        A read that keeps failing fails fast for the rest of its failure window,
+        and a recently expired response stands in for a failed refresh.
+
         Args:
             tool_name: Name of the tool (e.g., 'weather.get_daily')
             input_data: Input parameters for the tool
@@ -142,14 +224,30 @@ class MCPClient:
         Raises:
             MCPError: If the tool call fails
         """
+        cache = self._response_caches.get(tool_name)
+        if cache is not None:
+            key = orjson.dumps(input_data, option=orjson.OPT_SORT_KEYS)
+            return await cache.get_or_fetch(key, lambda: self._call_tool_uncached(tool_name, input_data))
+
+        result = await self._call_tool_uncached(tool_name, input_data)
+        if tool_name.startswith("calendar.") and tool_name not in self._response_caches:
+            # A calendar write makes cached event listings stale
+            self.clear_cache("calendar.")
+        return result
+
+    async def _call_tool_uncached(self, tool_name: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool on the MCP server without consulting the response cache."""
         url = f"{self.base_url}/tools/{tool_name}"
 
         logger.info(f"Calling MCP tool: {tool_name} with data: {input_data}")
+        started = time.perf_counter()
 
         try:
             response = await self._request_with_retry("POST", url, json_data=input_data)
-            result = response.json()
-            logger.success(f"Tool {tool_name} completed successfully")
+            result = orjson.loads(response.content)
+            # Generation time is what MCP_CACHE_TTLS trades against freshness
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.success(f"Tool {tool_name} completed successfully in {elapsed_ms:.0f}ms")
             return result
 
         except MCPError:
@@ -226,6 +324,18 @@ class MCPClient:
             params["departure_time"] = departure_time
         return await self.call_tool("mobility.get_shuttle_schedule", params)
 
+    async def get_financial_data(self, symbols: Iterable[str], data_type: str = "mixed") -> Dict[str, Any]:
+        """
+        Get financial data for stock and crypto symbols.
+
+        Symbols are upper-cased, de-duplicated and sorted so the same portfolio
+        always maps to the same cached response, however callers spell it.
+        """
+        return await self.call_tool("financial.get_data", {
+            "symbols": sorted({symbol.upper() for symbol in symbols}),
+            "data_type": data_type
+        })
+
     async def get_all_morning_data(self, date: str) -> Dict[str, Any]:
         """
         Get all morning routine data in parallel for speed.
@@ -239,42 +349,24 @@ class MCPClient:
         settings = get_settings()
 
         # Call all tools in parallel for speed
-        tasks = [
-            self.get_weather(settings.user_location),
-            self.get_calendar_events(date),
-            self.get_todos("work"),  # Still use "work" for morning briefing
-            self.get_commute_options("to_work")  # Use enhanced commute options for morning briefing
-        ]
+        tasks = {
+            "weather": self.get_weather(settings.user_location),
+            "calendar": self.get_calendar_events(date),
+            "todos": self.get_todos("work"),  # Still use "work" for morning briefing
+            "commute": self.get_commute_options("to_work"),  # Use enhanced commute options for morning briefing
+        }
 
         try:
-            weather, calendar, todos, commute = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await gather_named(tasks)
 
             # Handle any exceptions gracefully
             result: Dict[str, Any] = {}
-
-            if isinstance(weather, Exception):
-                logger.warning(f"Weather call failed: {weather}")
-                result["weather"] = {"error": str(weather)}
-            else:
-                result["weather"] = weather
-
-            if isinstance(calendar, Exception):
-                logger.warning(f"Calendar call failed: {calendar}")
-                result["calendar"] = {"error": str(calendar)}
-            else:
-                result["calendar"] = calendar
-
-            if isinstance(todos, Exception):
-                logger.warning(f"Todos call failed: {todos}")
-                result["todos"] = {"error": str(todos)}
-            else:
-                result["todos"] = todos
-
-            if isinstance(commute, Exception):
-                logger.warning(f"Commute call failed: {commute}")
-                result["commute"] = {"error": str(commute)}
-            else:
-                result["commute"] = commute
+            for name, value in results.items():
+                if isinstance(value, Exception):
+                    logger.warning(f"{name.title()} call failed: {value}")
+                    result[name] = {"error": str(value)}
+                else:
+                    result[name] = value
 
             return result
 
@@ -293,3 +385,43 @@ class MCPClient:
         except Exception as e:
             logger.error(f"MCP server health check failed: {e}")
             return False
+
+
+# Process-wide client instance (lazy initialization)
+_mcp_client: Optional[MCPClient] = None
+_mcp_client_lock = threading.Lock()
+
+
+def get_mcp_client() -> MCPClient:
+    """Get the shared MCP client, creating it on first use."""
+    global _mcp_client
+    if _mcp_client is None:
+        with _mcp_client_lock:
+            if _mcp_client is None:
+                _mcp_client = MCPClient()
+    return _mcp_client
+
+
+def reset_mcp_client() -> None:
+    """Reset the shared MCP client (useful for testing)."""
+    global _mcp_client
+    _mcp_client = None
+
+
+@atexit.register
+def close_background_client() -> None:
+    """Close the pooled HTTP client used by the sync tool wrappers at exit."""
+    if not background_loop_running():
+        return
+
+    async def close() -> None:
+        # No logging here: sinks may already be closed during interpreter shutdown
+        with MCPClient._clients_lock:
+            client = MCPClient._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    try:
+        run_coroutine_sync(close(), timeout=HEALTH_CHECK_TIMEOUT)
+    except Exception:
+        pass
@@ -10,9 +10,17 @@ from .error_handlers import (
 )
 from .async_helpers import (
     run_async,
+    run_coroutine_sync,
+    new_event_loop,
     gather_with_timeout,
+    gather_named,
     retry_async,
 )
+from .dates import (
+    get_today,
+    now_iso,
+    today_str,
+)
 from .constants import (
     APP_VERSION,
     DEFAULT_TIMEOUT,
@@ -32,8 +40,15 @@ __all__ = [
     "safe_async_call",
     # Async helpers
     "run_async",
+    "run_coroutine_sync",
+    "new_event_loop",
     "gather_with_timeout",
+    "gather_named",
     "retry_async",
+    # Date helpers
+    "get_today",
+    "today_str",
+    "now_iso",
     # Constants
     "APP_VERSION",
     "DEFAULT_TIMEOUT",
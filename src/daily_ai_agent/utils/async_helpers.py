@@ -1,12 +1,82 @@
 """Async utility functions for the Daily AI Agent."""
 
 import asyncio
-from typing import Any, Callable, TypeVar, Optional, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar, Optional, List
 from functools import wraps
 from loguru import logger
 
 T = TypeVar("T")
 
+# Marks "no stale value available" (None is a valid cached value)
+_MISSING: Any = object()
+
+# Result handed to joiners when the call they joined was cancelled
+_RETRY: Any = object()
+
+# Long-lived event loop for running coroutines from sync code
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create a new event loop, using uvloop when it is installed.
+
+    uvloop is an optional speedup (libuv-based, faster callback dispatch and
+    connection setup); the stdlib loop is used otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting its daemon thread on first use."""
+    global _background_loop
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                loop = new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="daily-ai-agent-loop", daemon=True
+                )
+                thread.start()
+                _background_loop = loop
+                logger.debug("Started background event loop")
+    return _background_loop
+
+
+def background_loop_running() -> bool:
+    """Whether the background loop used by run_coroutine_sync has been started."""
+    return _background_loop is not None and _background_loop.is_running()
+
+
+def run_coroutine_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Unlike asyncio.run, this reuses one long-lived loop instead of creating
+    and tearing one down per call, and works even when the caller's thread
+    already has a running loop. Loop-bound resources such as pooled HTTP
+    connections stay valid across calls.
+
+    Args:
+        coro: The coroutine to run
+        timeout: Maximum time to wait in seconds (None waits indefinitely)
+
+    Returns:
+        The coroutine's result
+    """
+    loop = _get_background_loop()
+    if threading.current_thread().name == "daily-ai-agent-loop":
+        raise RuntimeError("run_coroutine_sync cannot be called from the background loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
 
 def run_async(func: Callable[..., T]) -> Callable[..., T]:
     """
@@ -24,7 +94,7 @@ def run_async(func: Callable[..., T]) -> Callable[..., T]:
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        return asyncio.run(func(*args, **kwargs))
+        return run_coroutine_sync(func(*args, **kwargs))
 
     return wrapper
 
@@ -55,6 +125,21 @@ async def gather_with_timeout(
         raise
 
 
+async def gather_named(calls: Dict[str, Awaitable[Any]]) -> Dict[str, Any]:
+    """
+    Run named sub-calls concurrently, so a composite call takes as long as
+    its slowest part rather than the sum of all of them.
+
+    Args:
+        calls: Awaitables keyed by name
+
+    Returns:
+        Results keyed by the same names; a failed call maps to its exception
+    """
+    results = await asyncio.gather(*calls.values(), return_exceptions=True)
+    return dict(zip(calls, results))
+
+
 async def retry_async(
     func: Callable[..., T],
     *args: Any,
@@ -137,3 +222,167 @@ class AsyncBatcher:
             results.extend(batch_results)
         self._pending = []
         return results
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one in-flight call.
+
+    Callers on the loop that started a call share its result or exception.
+    Cancelling the caller that started it doesn't cancel the others: they
+    retry, and one of them makes the call instead.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``call`` for a key, or wait for the identical call already running.
+
+        Args:
+            key: Key identifying identical calls
+            call: Zero-argument coroutine function making the call
+
+        Returns:
+            The result of the (shared) call
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._in_flight.get(key)
+        while pending is not None and pending.get_loop() is loop:
+            result = await asyncio.shield(pending)
+            if result is not _RETRY:
+                return result
+            pending = self._in_flight.get(key)
+
+        future = loop.create_future()
+        self._in_flight[key] = future
+        try:
+            result = await call()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unjoined failure isn't logged as never retrieved
+            future.exception()
+            raise
+        except BaseException:
+            # The cancellation is this caller's alone; wake joiners to retry
+            future.set_result(_RETRY)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+
+class AsyncTTLCache:
+    """
+    In-memory TTL cache for async fetches with request coalescing.
+
+    Concurrent misses for the same key share a single in-flight fetch
+    (singleflight), so N identical calls cost one round trip. Optionally, a
+    key that keeps failing fails fast until its failure window ends, and an
+    expired value can stand in for a failed refresh for a while.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 256,
+        failure_threshold: int = 0,
+        failure_window_seconds: float = 0.0,
+        stale_if_error_seconds: float = 0.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a fetched value stays fresh (0 only coalesces in-flight fetches)
+            max_entries: Maximum number of cached values (least recently used are evicted)
+            failure_threshold: Failures of one key after which it fails fast (0 disables)
+            failure_window_seconds: Window, from a key's first failure, in which failures are counted
+            stale_if_error_seconds: How long past expiry a value may be served when a refresh fails
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.failure_threshold = failure_threshold
+        self.failure_window_seconds = failure_window_seconds
+        self.stale_if_error_seconds = stale_if_error_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight = SingleFlight()
+        # key -> (failure count, window start, last error)
+        self._failures: "OrderedDict[Hashable, Tuple[int, float, Exception]]" = OrderedDict()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Get a fresh cached value, or fetch and cache it.
+
+        Args:
+            key: Cache key
+            fetch: Zero-argument coroutine function producing the value
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        stale = _MISSING
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            now = time.monotonic()
+            if now < expires_at:
+                self._entries.move_to_end(key)
+                return value
+            if now < expires_at + self.stale_if_error_seconds:
+                stale = value
+            else:
+                del self._entries[key]
+
+        failure = self._failures.get(key)
+        if failure is not None:
+            count, window_start, error = failure
+            if time.monotonic() - window_start >= self.failure_window_seconds:
+                del self._failures[key]
+            elif count >= self.failure_threshold:
+                if stale is not _MISSING:
+                    return stale
+                logger.warning(f"Failing fast after {count} recent failures: {error}")
+                # Drop the previous raise's frames so the traceback doesn't grow per hit
+                raise error.with_traceback(None)
+
+        async def fetch_and_store() -> T:
+            try:
+                value = await fetch()
+            except Exception as e:
+                self._record_failure(key, e)
+                if stale is _MISSING:
+                    raise
+                logger.warning(f"Serving stale value after failed refresh: {e}")
+                return stale
+            self._failures.pop(key, None)
+            if self.ttl_seconds > 0:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return value
+
+        # Join an identical fetch already running on this loop
+        return await self._in_flight.do(key, fetch_and_store)
+
+    def _record_failure(self, key: Hashable, error: Exception) -> None:
+        """Count a failed fetch towards the key's fail-fast threshold."""
+        if self.failure_threshold <= 0:
+            return
+        count, window_start, _ = self._failures.pop(key, (0, time.monotonic(), error))
+        self._failures[key] = (count + 1, window_start, error)
+        while len(self._failures) > self.max_entries:
+            self._failures.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached values and recorded failures."""
+        self._entries.clear()
+        self._failures.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,6 +1,7 @@
 """Constants and configuration values for the Daily AI Agent."""
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 # Application metadata
 APP_NAME = "Daily AI Agent"
@@ -13,6 +14,31 @@ MCP_SERVER_TIMEOUT = 45
 HEALTH_CHECK_TIMEOUT = 10
 LLM_TIMEOUT = 60
 
+# How often the cached "today" value is re-checked (in seconds)
+DATE_RECHECK_SECONDS = 60
+
+# Freshness (in seconds) of cached read-only MCP tool responses.
+# A TTL of 0 only coalesces identical concurrent calls (live data).
+MCP_CACHE_TTLS: Dict[str, int] = {
+    "weather.get_daily": 300,
+    "calendar.list_events": 60,
+    "calendar.list_events_range": 60,
+    "mobility.get_shuttle_schedule": 300,
+    "financial.get_data": 30,
+    "todo.list": 0,
+    "mobility.get_commute": 0,
+    "mobility.get_commute_options": 0,
+}
+MCP_CACHE_MAX_ENTRIES = 256
+
+# Identical read-only MCP calls that fail this many times within the window
+# fail fast until the window ends, so an agent retry loop can't hammer the server
+MCP_FAILURE_THRESHOLD = 3
+MCP_FAILURE_WINDOW_SECONDS = 30
+
+# How long past its TTL a cached MCP response may be served if a refresh fails
+MCP_STALE_IF_ERROR_SECONDS = 600
+
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0
@@ -25,7 +51,7 @@ CHAT_RATE_LIMIT_PER_MINUTE = 10
 BRIEFING_RATE_LIMIT_PER_MINUTE = 20
 
 # Default financial symbols for morning briefing
-FINANCIAL_SYMBOLS: List[str] = [
+FINANCIAL_SYMBOLS: Tuple[str, ...] = (
     "MSFT",   # Microsoft
     "NVDA",   # NVIDIA
     "BTC",    # Bitcoin
@@ -33,14 +59,14 @@ FINANCIAL_SYMBOLS: List[str] = [
     "VOO",    # Vanguard S&P 500 ETF
     "SMR",    # NuScale Power
     "GOOGL",  # Google/Alphabet
-]
+)
 
 # Shuttle stop name mappings for display
-SHUTTLE_STOP_NAMES: Dict[str, str] = {
+SHUTTLE_STOP_NAMES: Mapping[str, str] = MappingProxyType({
     "mountain_view_caltrain": "Mountain View Caltrain",
     "linkedin_transit_center": "LinkedIn Transit Center",
     "linkedin_950_1000": "LinkedIn 950|1000",
-}
+})
 
 # Valid shuttle stop IDs
 VALID_SHUTTLE_STOPS: List[str] = [
@@ -88,6 +114,19 @@ WEATHER_TIMES: List[str] = [
 DEFAULT_LLM_MODEL = "gpt-4o-mini"
 DEFAULT_LLM_TEMPERATURE = 0.1
 
+# OpenAI Batch API completion window for scheduled briefings
+BATCH_COMPLETION_WINDOW = "24h"
+
+# LLM response cache
+LLM_CACHE_MAX_ENTRIES = 256
+
+# Conversation memory limits
+HISTORY_SUMMARY_MAX_CHARS = 2000
+HISTORY_SUMMARY_SNIPPET_CHARS = 200
+
+# Rough characters-per-token ratio used when tiktoken is unavailable
+CHARS_PER_TOKEN_ESTIMATE = 4
+
 # API response status codes
 HTTP_OK = 200
 HTTP_BAD_REQUEST = 400
@@ -0,0 +1,58 @@
+"""Date helpers for the Daily AI Agent."""
+
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Tuple
+
+from .constants import DATE_RECHECK_SECONDS
+
+# Cached "today" values, refreshed at most every DATE_RECHECK_SECONDS
+_today_cache: Dict[str, Any] = {"date": None, "value": None, "checked_at": 0.0}
+
+# Cached response timestamp for the current whole second
+_now_cache: Dict[str, Any] = {"second": None, "value": ""}
+
+
+def get_today() -> Tuple[str, str]:
+    """
+    Get today's date as (YYYY-MM-DD, "Weekday, Month DD, YYYY").
+
+    The formatted strings are only rebuilt when the date actually changes, so
+    repeated calls return the very same string objects and anything derived
+    from them (prompt variables, cache keys) stays byte-stable within a day.
+
+    Returns:
+        Tuple of ISO date and human-readable day
+    """
+    now = time.monotonic()
+    if _today_cache["value"] is None or now - _today_cache["checked_at"] > DATE_RECHECK_SECONDS:
+        today = date.today()
+        if today != _today_cache["date"]:
+            _today_cache["date"] = today
+            _today_cache["value"] = (today.isoformat(), today.strftime("%A, %B %d, %Y"))
+        _today_cache["checked_at"] = now
+    return _today_cache["value"]
+
+
+def today_str() -> str:
+    """Get today's date in YYYY-MM-DD format."""
+    return get_today()[0]
+
+
+def now_iso() -> str:
+    """
+    Get the current local time as an ISO 8601 string, at one-second resolution.
+
+    The string is built once per second and reused, so busy endpoints that
+    stamp every response don't each pay for datetime construction.
+    """
+    second = int(time.time())
+    if second != _now_cache["second"]:
+        _now_cache["value"] = datetime.fromtimestamp(second).isoformat()
+        _now_cache["second"] = second
+    return _now_cache["value"]
+
+
+def reset_today_cache() -> None:
+    """Reset the cached date (useful for testing)."""
+    _today_cache.update({"date": None, "value": None, "checked_at": 0.0})
@@ -5,6 +5,8 @@ from functools import wraps
 import asyncio
 from loguru import logger
 
+from .async_helpers import run_coroutine_sync
+
 
 # Custom exception types for better error categorization
 class APIError(Exception):
@@ -20,7 +22,15 @@ class APIError(Exception):
 class MCPError(APIError):
     """Exception for MCP server communication errors."""
 
-    def __init__(self, message: str, status_code: int = 503, details: Optional[dict] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 503,
+        details: Optional[dict] = None,
+        retriable: bool = False,
+    ):
+        # Whether the failure was transient (timeouts, 5xx, rate limits) and may succeed later
+        self.retriable = retriable
         super().__init__(f"MCP Server Error: {message}", status_code, details)
 
 
@@ -87,6 +97,9 @@ def safe_async_call(
     """
     Safely execute an async function and return a default value on error.
 
+    Coroutine functions run on the shared background loop, so this must not
+    be called from code already running on that loop.
+
     Args:
         func: The async function to call
         *args: Positional arguments for the function
@@ -99,7 +112,8 @@ def safe_async_call(
     """
     try:
         if asyncio.iscoroutinefunction(func):
-            return asyncio.run(func(*args, **kwargs))
+            # Reuse the shared background loop rather than starting one per call
+            return run_coroutine_sync(func(*args, **kwargs))
         return func(*args, **kwargs)
     except Exception as e:
         logger.error(f"{error_prefix}: {e}")
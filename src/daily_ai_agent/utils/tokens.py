@@ -0,0 +1,45 @@
+"""Token counting helpers for the Daily AI Agent."""
+
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+from loguru import logger
+
+from .constants import CHARS_PER_TOKEN_ESTIMATE, DEFAULT_LLM_MODEL
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    """
+    Load the tiktoken encoding for the default model, once.
+
+    tiktoken downloads its encoding files on first use, so this can fail
+    offline; callers then fall back to a length-based estimate.
+    """
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(DEFAULT_LLM_MODEL)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating token counts: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens in a piece of text for the default model.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Exact token count, or an estimate if tiktoken is unavailable
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN_ESTIMATE + 1
+    return len(encoding.encode(text))
+
+
+def count_message_tokens(messages: Iterable[Any]) -> int:
+    """Count the tokens in the content of a sequence of chat messages."""
+    return sum(count_tokens(str(message.content)) for message in messages)
@@ -21,8 +21,13 @@ def mock_settings() -> Generator[MagicMock, None, None]:
         settings.default_llm = "openai"
         settings.mcp_server_url = "http://test-mcp-server:8000"
         settings.mcp_server_timeout = 30
+        settings.mcp_max_concurrency = 8
         settings.log_level = "INFO"
         settings.enable_memory = True
+        settings.max_history_turns = 10
+        settings.max_context_tokens = 16000
+        settings.max_concurrency = 5
+        settings.llm_cache_ttl_seconds = 300
         settings.debug = True
         settings.environment = "testing"
         settings.host = "0.0.0.0"
@@ -33,6 +38,7 @@ def mock_settings() -> Generator[MagicMock, None, None]:
         settings.user_location = "San Francisco"
         settings.default_commute_origin = "Home"
         settings.default_commute_destination = "Office"
+        settings.briefing_symbols = ("MSFT", "BTC")
         mock.return_value = settings
         yield settings
 
@@ -229,3 +235,22 @@ def client(app):
 def runner(app):
     """Create Flask CLI test runner."""
     return app.test_cli_runner()
+
+
+@pytest.fixture(autouse=True)
+def reset_agent_caches() -> Generator[None, None, None]:
+    """Reset process-wide agent caches so patched LLMs and agents don't leak between tests."""
+    yield
+    from daily_ai_agent.agent.orchestrator import (
+        clear_agent_cache,
+        clear_llm_cache,
+        reset_orchestrator,
+    )
+    from daily_ai_agent.services.llm_cache import reset_llm_cache
+    from daily_ai_agent.services.mcp_client import MCPClient, reset_mcp_client
+    clear_agent_cache()
+    clear_llm_cache()
+    reset_orchestrator()
+    reset_llm_cache()
+    reset_mcp_client()
+    MCPClient.clear_cache()
@@ -44,7 +44,7 @@ class TestAgentMemoryBasics:
             orchestrator = AgentOrchestrator()
 
             assert orchestrator.enable_memory is True
-            assert orchestrator.chat_history == []
+            assert list(orchestrator.chat_history) == []
 
     def test_memory_can_be_disabled(self, mock_settings):
         """Test that memory can be explicitly disabled."""
@@ -72,7 +72,7 @@ class TestAgentMemoryBasics:
         mock_orchestrator.clear_memory()
 
         assert mock_orchestrator.get_memory_length() == 0
-        assert mock_orchestrator.chat_history == []
+        assert list(mock_orchestrator.chat_history) == []
 
     def test_get_memory_length(self, mock_orchestrator):
         """Test that get_memory_length() returns correct count."""
@@ -180,7 +180,7 @@ class TestAgentMemoryWithChat:
             # Track history length at each call
             history_lengths = []
 
-            async def track_history_length(payload):
+            async def track_history_length(payload, config=None):
                 if "chat_history" in payload:
                     history_lengths.append(len(payload["chat_history"]))
                 else:
@@ -287,7 +287,7 @@ class TestAgentMemoryContextUnderstanding:
             # Track history content at each call
             captured_histories = []
 
-            async def capture_history(payload):
+            async def capture_history(payload, config=None):
                 if "chat_history" in payload:
                     # Deep copy the history content
                     captured_histories.append([
@@ -328,7 +328,7 @@ class TestAgentMemoryContextUnderstanding:
 
             captured_histories = []
 
-            async def capture_history(payload):
+            async def capture_history(payload, config=None):
                 if "chat_history" in payload:
                     captured_histories.append([
                         (type(m).__name__, m.content) for m in payload["chat_history"]
@@ -362,7 +362,7 @@ class TestAgentMemoryContextUnderstanding:
 
             captured_histories = []
 
-            async def capture_history(payload):
+            async def capture_history(payload, config=None):
                 if "chat_history" in payload:
                     captured_histories.append([
                         (type(m).__name__, m.content) for m in payload["chat_history"]
@@ -402,7 +402,7 @@ class TestAgentMemoryContextUnderstanding:
 
             captured_histories = []
 
-            async def capture_history(payload):
+            async def capture_history(payload, config=None):
                 if "chat_history" in payload:
                     captured_histories.append([
                         (type(m).__name__, m.content) for m in payload["chat_history"]
@@ -427,6 +427,174 @@ class TestAgentMemoryContextUnderstanding:
             assert len(captured_histories[1]) == 0
 
 
+class TestHistoryWindow:
+    """Test that conversation history is bounded to the last few turns."""
+
+    @pytest.fixture
+    def orchestrator_with_mock_agent(self, mock_settings):
+        """Create an orchestrator whose agent echoes the input."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+            mock_agent = AsyncMock()
+            captured_histories = []
+
+            async def capture(payload, config=None):
+                captured_histories.append(list(payload.get("chat_history", [])))
+                return {"output": f"Reply to {payload['input']}"}
+
+            mock_agent.ainvoke.side_effect = capture
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator(
+                use_cached_tools=True, enable_memory=True, max_history_turns=2
+            )
+
+            yield orchestrator, captured_histories
+
+    @pytest.mark.asyncio
+    async def test_history_keeps_last_turns(self, orchestrator_with_mock_agent):
+        """Test that only the last max_history_turns exchanges are kept."""
+        orchestrator, _ = orchestrator_with_mock_agent
+
+        for i in range(5):
+            await orchestrator.chat(f"Message {i}")
+
+        history = orchestrator.get_chat_history()
+        assert len(history) == 4
+        assert history[0].content == "Message 3"
+        assert history[-1].content == "Reply to Message 4"
+
+    @pytest.mark.asyncio
+    async def test_evicted_turns_are_summarized(self, orchestrator_with_mock_agent):
+        """Test that evicted turns are sent to the agent as a leading summary."""
+        orchestrator, captured_histories = orchestrator_with_mock_agent
+
+        for i in range(4):
+            await orchestrator.chat(f"Message {i}")
+
+        last_history = captured_histories[-1]
+        assert type(last_history[0]).__name__ == "SystemMessage"
+        assert "User: Message 0" in last_history[0].content
+        assert "Assistant: Reply to Message 0" in last_history[0].content
+        assert len(last_history) == 5
+
+    @pytest.mark.asyncio
+    async def test_clear_memory_drops_summary(self, orchestrator_with_mock_agent):
+        """Test that clearing memory also forgets the summary of older turns."""
+        orchestrator, captured_histories = orchestrator_with_mock_agent
+
+        for i in range(4):
+            await orchestrator.chat(f"Message {i}")
+        orchestrator.clear_memory()
+        await orchestrator.chat("Fresh start")
+
+        assert captured_histories[-1] == []
+
+    def test_unbounded_history_when_turns_is_zero(self, mock_settings):
+        """Test that max_history_turns=0 keeps every message."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor"), \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            from langchain_core.messages import HumanMessage
+
+            orchestrator = AgentOrchestrator(enable_memory=True, max_history_turns=0)
+            for i in range(50):
+                orchestrator._remember(HumanMessage(content=f"Message {i}"))
+
+            assert orchestrator.get_memory_length() == 50
+
+    @staticmethod
+    def _words(text):
+        """Count tokens as words, so budgets can be measured from the messages."""
+        return len(text.split())
+
+    @staticmethod
+    async def _fill_history(orchestrator):
+        """Hold two long exchanges in memory and return the messages."""
+        for i in range(2):
+            await orchestrator.chat(f"Message {i} " + "word " * 50)
+        return list(orchestrator.chat_history)
+
+    def _summary_size(self, orchestrator, evicted):
+        """Measure the summary the orchestrator would write for the evicted messages."""
+        saved = orchestrator._history_summary
+        for message in evicted:
+            orchestrator._summarize_evicted(message)
+        size = self._words(orchestrator._history_summary)
+        orchestrator._history_summary = saved
+        return size
+
+    async def _chat_with_budget(self, orchestrator, budget):
+        """Send a turn with tokens counted as words and a fixed context budget."""
+        with patch("daily_ai_agent.agent.orchestrator.count_tokens", side_effect=self._words), \
+             patch("daily_ai_agent.agent.orchestrator.count_message_tokens",
+                   side_effect=lambda messages: sum(self._words(str(m.content)) for m in messages)), \
+             patch.object(orchestrator.settings, "max_context_tokens", budget):
+            orchestrator._prompt_tokens = 0
+            await orchestrator.chat("Latest")
+
+    @pytest.mark.asyncio
+    async def test_history_trimmed_to_token_budget(self, orchestrator_with_mock_agent):
+        """Test that the oldest exchange is evicted when the token budget is exceeded."""
+        orchestrator, captured_histories = orchestrator_with_mock_agent
+        history = await self._fill_history(orchestrator)
+
+        # Room for the summary of the first exchange plus the second exchange
+        budget = (
+            self._words("Latest")
+            + self._summary_size(orchestrator, history[:2])
+            + sum(self._words(m.content) for m in history[2:])
+        )
+        await self._chat_with_budget(orchestrator, budget)
+
+        sent = captured_histories[-1]
+        assert type(sent[0]).__name__ == "SystemMessage"
+        assert "User: Message 0" in sent[0].content
+        assert sent[1:] == history[2:]
+
+    @pytest.mark.asyncio
+    async def test_budget_counts_the_growing_summary(self, orchestrator_with_mock_agent):
+        """Test that the summary written while evicting is counted against the budget."""
+        orchestrator, captured_histories = orchestrator_with_mock_agent
+        history = await self._fill_history(orchestrator)
+
+        # One token short of fitting once the first exchange's summary is counted
+        budget = (
+            self._words("Latest")
+            + self._summary_size(orchestrator, history[:2])
+            + sum(self._words(m.content) for m in history[2:])
+            - 1
+        )
+        await self._chat_with_budget(orchestrator, budget)
+
+        sent = captured_histories[-1]
+        assert len(sent) == 1
+        assert "User: Message 1" in sent[0].content
+
+    @pytest.mark.asyncio
+    async def test_budget_evicts_whole_exchanges(self, orchestrator_with_mock_agent):
+        """Test that eviction never leaves a reply without its question at the head of the history."""
+        orchestrator, captured_histories = orchestrator_with_mock_agent
+        history = await self._fill_history(orchestrator)
+
+        # Without a summary, dropping only the first question would just fit
+        budget = self._words("Latest") + sum(self._words(m.content) for m in history[1:])
+        with patch.object(orchestrator, "_summarize_evicted"):
+            await self._chat_with_budget(orchestrator, budget)
+
+        assert captured_histories[-1] == history[2:]
+
+
 class TestMemoryPersistenceAcrossInstances:
     """Test that memory is instance-specific (no cross-contamination)."""
 
@@ -1,5 +1,6 @@
 """Tests for the Flask API endpoints."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import json
@@ -29,6 +30,13 @@ class TestHealthEndpoint:
             assert "mcp_server" in data
             assert "ai_enabled" in data
 
+    def test_health_check_is_not_rate_limited(self, client):
+        """Test health checks never count against the rate limit."""
+        from daily_ai_agent.models.config import get_settings
+
+        for _ in range(get_settings().rate_limit_per_minute + 1):
+            assert client.get("/health").status_code == 200
+
 
 class TestChatEndpoint:
     """Tests for the /chat endpoint."""
@@ -51,6 +59,21 @@ class TestChatEndpoint:
         )
         assert response.status_code == 400
 
+    def test_chat_rejects_non_string_message(self, client):
+        """Test chat endpoint rejects a message that isn't a string."""
+        response = client.post(
+            "/chat",
+            data=json.dumps({"message": 42}),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+
+    def test_chat_rejects_malformed_json(self, client):
+        """Test chat endpoint rejects a body that isn't valid JSON."""
+        response = client.post("/chat", data="{not json", content_type="application/json")
+        assert response.status_code == 400
+        assert "request_id" in json.loads(response.data)
+
     def test_chat_success(self, client):
         """Test successful chat request."""
         with patch("daily_ai_agent.api.AgentOrchestrator") as mock_orch_class:
@@ -111,6 +134,52 @@ class TestWeatherEndpoint:
             response = test_client.get("/tools/weather?location=New%20York")
             assert response.status_code == 200
 
+    def test_requests_share_one_event_loop(self, client):
+        """Test async views run on one long-lived loop, so pooled connections persist."""
+        loops = []
+
+        async def get_weather(*args, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return {"location": "San Francisco", "temp_hi": 72}
+
+        with patch("daily_ai_agent.api.MCPClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.get_weather = AsyncMock(side_effect=get_weather)
+            mock_client_class.return_value = mock_client
+
+            from daily_ai_agent.api import create_app
+            test_client = create_app(testing=True).test_client()
+
+            assert test_client.get("/tools/weather").status_code == 200
+            assert test_client.get("/tools/weather").status_code == 200
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
+    def test_weather_honours_if_none_match(self, client):
+        """Test an unchanged forecast is answered with a bodyless 304."""
+        with patch("daily_ai_agent.api.MCPClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.get_weather = AsyncMock(
+                return_value={"location": "San Francisco", "temp_hi": 72}
+            )
+            mock_client_class.return_value = mock_client
+
+            from daily_ai_agent.api import create_app
+            test_client = create_app(testing=True).test_client()
+
+            first = test_client.get("/tools/weather")
+            etag = first.headers["ETag"]
+            assert first.status_code == 200
+
+            second = test_client.get("/tools/weather", headers={"If-None-Match": etag})
+            assert second.status_code == 304
+            assert second.data == b""
+
+            mock_client.get_weather.return_value = {"location": "San Francisco", "temp_hi": 75}
+            third = test_client.get("/tools/weather", headers={"If-None-Match": etag})
+            assert third.status_code == 200
+
 
 class TestTodosEndpoint:
     """Tests for the /tools/todos endpoint."""
@@ -199,11 +268,21 @@ class TestFinancialEndpoint:
         )
         assert response.status_code == 400
 
+    def test_financial_rejects_invalid_symbols_and_type(self, client):
+        """Test financial endpoint rejects non-string symbols and unknown data types."""
+        for body in ({"symbols": [42]}, {"symbols": ["MSFT"], "data_type": "bonds"}):
+            response = client.post(
+                "/tools/financial",
+                data=json.dumps(body),
+                content_type="application/json",
+            )
+            assert response.status_code == 400
+
     def test_financial_success(self, client, sample_financial_data):
         """Test successful financial request."""
         with patch("daily_ai_agent.api.MCPClient") as mock_client_class:
             mock_client = MagicMock()
-            mock_client.call_tool = AsyncMock(return_value=sample_financial_data)
+            mock_client.get_financial_data = AsyncMock(return_value=sample_financial_data)
             mock_client_class.return_value = mock_client
 
             from daily_ai_agent.api import create_app
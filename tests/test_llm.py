@@ -0,0 +1,115 @@
+"""Tests for the LLM service."""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from daily_ai_agent.services.llm import LLMService
+from daily_ai_agent.utils.error_handlers import APIError
+
+
+class TestBriefingBatch:
+    """Tests for Batch API morning briefings."""
+
+    @pytest.fixture
+    def service(self, mock_settings):
+        """Create an LLMService around a mocked chat model."""
+        llm = MagicMock()
+        llm.model_name = "gpt-4o-mini"
+        llm.temperature = 0.1
+        llm.root_async_client = AsyncMock()
+        return LLMService(llm=llm)
+
+    @pytest.mark.asyncio
+    async def test_submit_uploads_jsonl_and_creates_batch(self, service, sample_morning_data):
+        """Test that the briefing request is uploaded and batched."""
+        client = service.llm.root_async_client
+        client.files.create.return_value = MagicMock(id="file-123")
+        client.batches.create.return_value = MagicMock(id="batch-456")
+
+        batch_id = await service.submit_briefing_batch(sample_morning_data, custom_id="briefing-2025-01-15")
+
+        assert batch_id == "batch-456"
+        filename, content = client.files.create.call_args[1]["file"]
+        request = json.loads(content)
+        assert request["custom_id"] == "briefing-2025-01-15"
+        assert request["body"]["model"] == "gpt-4o-mini"
+        assert [m["role"] for m in request["body"]["messages"]] == ["system", "user"]
+        assert client.batches.create.call_args[1]["input_file_id"] == "file-123"
+
+    @pytest.mark.asyncio
+    async def test_collect_returns_none_while_running(self, service):
+        """Test that an unfinished batch yields no briefing yet."""
+        client = service.llm.root_async_client
+        client.batches.retrieve.return_value = MagicMock(status="in_progress")
+
+        assert await service.collect_briefing_batch("batch-456") is None
+
+    @pytest.mark.asyncio
+    async def test_collect_returns_briefing_when_done(self, service):
+        """Test that the completion text is read from the output file."""
+        client = service.llm.root_async_client
+        client.batches.retrieve.return_value = MagicMock(status="completed", output_file_id="file-out")
+        line = {
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": " Good morning! "}}]}},
+            "error": None,
+        }
+        client.files.content.return_value = MagicMock(content=json.dumps(line).encode() + b"\n")
+
+        assert await service.collect_briefing_batch("batch-456") == "Good morning!"
+
+    @pytest.mark.asyncio
+    async def test_collect_raises_on_failed_batch(self, service):
+        """Test that a failed batch raises an APIError."""
+        client = service.llm.root_async_client
+        client.batches.retrieve.return_value = MagicMock(status="failed", output_file_id=None)
+
+        with pytest.raises(APIError):
+            await service.collect_briefing_batch("batch-456")
+
+    @pytest.mark.asyncio
+    async def test_collect_returns_none_while_cancelling(self, service):
+        """Test that a batch still being cancelled is treated as in flight."""
+        client = service.llm.root_async_client
+        client.batches.retrieve.return_value = MagicMock(status="cancelling")
+
+        assert await service.collect_briefing_batch("batch-456") is None
+
+    @pytest.mark.asyncio
+    async def test_collect_reports_error_file_of_completed_batch(self, service):
+        """Test that a completed batch with only an error file raises the request's error."""
+        client = service.llm.root_async_client
+        client.batches.retrieve.return_value = MagicMock(
+            status="completed", output_file_id=None, error_file_id="file-err"
+        )
+        line = {
+            "response": {"status_code": 400, "body": {"error": {"message": "Invalid model"}}},
+            "error": None,
+        }
+        client.files.content.return_value = MagicMock(content=json.dumps(line).encode() + b"\n")
+
+        with pytest.raises(APIError, match="Invalid model"):
+            await service.collect_briefing_batch("batch-456")
+        client.files.content.assert_awaited_once_with("file-err")
+
+    @pytest.mark.asyncio
+    async def test_collect_raises_on_errored_result_line(self, service):
+        """Test that a line with no response raises an APIError instead of a TypeError."""
+        client = service.llm.root_async_client
+        client.batches.retrieve.return_value = MagicMock(status="completed", output_file_id="file-out")
+        line = {"response": None, "error": {"code": "server_error", "message": "Request failed"}}
+        client.files.content.return_value = MagicMock(content=json.dumps(line).encode() + b"\n")
+
+        with pytest.raises(APIError, match="Request failed"):
+            await service.collect_briefing_batch("batch-456")
+
+    @pytest.mark.asyncio
+    async def test_collect_raises_on_failed_response_status(self, service):
+        """Test that a non-200 response in the output file raises an APIError instead of a KeyError."""
+        client = service.llm.root_async_client
+        client.batches.retrieve.return_value = MagicMock(status="completed", output_file_id="file-out")
+        line = {"response": {"status_code": 500, "body": {"error": {"message": "Server error"}}}, "error": None}
+        client.files.content.return_value = MagicMock(content=json.dumps(line).encode() + b"\n")
+
+        with pytest.raises(APIError, match="Server error"):
+            await service.collect_briefing_batch("batch-456")
@@ -0,0 +1,204 @@
+"""Tests for the LLM response cache."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from daily_ai_agent.services.llm_cache import LLMCache
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_make_key_is_stable(self):
+        """Test that the key ignores argument order but not values."""
+        first = LLMCache.make_key(model="gpt-4o-mini", input="Hi", date="2025-01-15")
+        second = LLMCache.make_key(date="2025-01-15", input="Hi", model="gpt-4o-mini")
+        other_day = LLMCache.make_key(model="gpt-4o-mini", input="Hi", date="2025-01-16")
+
+        assert first == second
+        assert first != other_day
+
+    def test_normalize_input_ignores_case_spacing_and_punctuation(self):
+        """Test trivially different wordings of a question normalize alike."""
+        assert LLMCache.normalize_input("What's the weather?") == "what's the weather"
+        assert LLMCache.normalize_input("  what's  the WEATHER ") == "what's the weather"
+        assert LLMCache.normalize_input("Weather today") != LLMCache.normalize_input("Weather tomorrow")
+
+    def test_get_returns_stored_value(self):
+        """Test a stored response is returned until it expires."""
+        cache = LLMCache(ttl_seconds=60)
+
+        with patch("daily_ai_agent.services.llm_cache.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            cache.set("key", "Sunny")
+            assert cache.get("key") == "Sunny"
+
+            mock_time.monotonic.return_value = 161.0
+            assert cache.get("key") is None
+            assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = LLMCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_computation(self):
+        """Test identical in-flight requests wait for the first one's answer."""
+        cache = LLMCache(ttl_seconds=0)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "Sunny", True
+
+        results = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(3)))
+
+        assert results == ["Sunny"] * 3
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_joiners(self):
+        """Test a request waiting on an identical in-flight call still gets an answer if that call's caller is cancelled."""
+        cache = LLMCache(ttl_seconds=60)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "Sunny", True
+
+        leader = asyncio.create_task(cache.get_or_compute("key", compute))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(cache.get_or_compute("key", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await joiner == "Sunny"
+        assert leader.cancelled()
+        assert calls == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of 0 turns the cache off."""
+        cache = LLMCache(ttl_seconds=0)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+
+class TestOrchestratorResponseCache:
+    """Tests for response caching in the orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_skips_agent(self, mock_settings):
+        """Test that a repeated question, however it is cased or spaced, is answered from the cache."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.return_value = {"output": "Sunny and 72°F"}
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            first = AgentOrchestrator(enable_memory=False)
+            second = AgentOrchestrator(enable_memory=False)
+
+            assert await first.chat("What's the weather?") == "Sunny and 72°F"
+            assert await second.chat("what's the  weather") == "Sunny and 72°F"
+            mock_agent.ainvoke.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_history_is_part_of_the_key(self, mock_settings):
+        """Test that the same question in a different conversation is not reused."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.return_value = {"output": "OK"}
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator(enable_memory=True)
+
+            await orchestrator.chat("Yes")
+            await orchestrator.chat("Yes")
+
+            assert mock_agent.ainvoke.call_count == 2
+
+    @staticmethod
+    def _step(tool: str, observation: str):
+        from langchain_core.agents import AgentAction
+        return (AgentAction(tool=tool, tool_input={}, log=""), observation)
+
+    @pytest.mark.asyncio
+    async def test_write_turns_are_not_cached(self, mock_settings):
+        """Test that repeating a request that created an event runs the agent again."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            from daily_ai_agent.agent.tools import get_all_tools
+            mock_tools.return_value = get_all_tools()
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.return_value = {
+                "output": "Created 'Lunch' at noon",
+                "intermediate_steps": [self._step("create_calendar_event", "✅ Event created")],
+            }
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator(enable_memory=False)
+
+            await orchestrator.chat("Schedule lunch at noon")
+            await orchestrator.chat("Schedule lunch at noon")
+
+            assert mock_agent.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_tool_calls_are_not_cached(self, mock_settings):
+        """Test that an answer built on a tool error is not replayed, while a read-only success is."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            from daily_ai_agent.agent.tools import get_all_tools
+            mock_tools.return_value = get_all_tools()
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.side_effect = [
+                {
+                    "output": "The weather service is down right now.",
+                    "intermediate_steps": [self._step("get_weather", "Error getting weather: timed out")],
+                },
+                {
+                    "output": "Sunny and 72°F",
+                    "intermediate_steps": [self._step("get_weather", "Sunny, 72°F")],
+                },
+            ]
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator(enable_memory=False)
+
+            assert await orchestrator.chat("What's the weather?") == "The weather service is down right now."
+            assert await orchestrator.chat("What's the weather?") == "Sunny and 72°F"
+            assert await orchestrator.chat("What's the weather?") == "Sunny and 72°F"
+            assert mock_agent.ainvoke.call_count == 2
@@ -1,10 +1,13 @@
 """Tests for the MCP client service."""
 
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
 
 from daily_ai_agent.services.mcp_client import MCPClient
+from daily_ai_agent.utils.error_handlers import MCPError
 
 
 class TestMCPClient:
@@ -19,7 +22,7 @@ class TestMCPClient:
     async def test_call_tool_success(self, client, sample_weather_data):
         """Test successful tool call."""
         mock_response = MagicMock()
-        mock_response.json.return_value = sample_weather_data
+        mock_response.content = json.dumps(sample_weather_data).encode()
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
@@ -69,6 +72,33 @@ class TestMCPClient:
                 await client.call_tool("weather.get_daily", {"location": "SF"})
             assert "Timeout" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_exhausted_network_retries_are_retriable(self, client):
+        """Test transient failures surface as retriable after all retries."""
+        http_client = MagicMock()
+        http_client.post = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+        with patch.object(MCPClient, "get_client", AsyncMock(return_value=http_client)), \
+             patch("daily_ai_agent.services.mcp_client.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(MCPError) as exc_info:
+                await client.call_tool("todo.list", {})
+
+        assert exc_info.value.retriable is True
+        assert http_client.post.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_non_network_errors_are_not_retried(self, client):
+        """Test unexpected errors fail fast without retries."""
+        http_client = MagicMock()
+        http_client.post = AsyncMock(side_effect=RuntimeError("bad state"))
+
+        with patch.object(MCPClient, "get_client", AsyncMock(return_value=http_client)):
+            with pytest.raises(MCPError) as exc_info:
+                await client.call_tool("todo.list", {})
+
+        assert exc_info.value.retriable is False
+        http_client.post.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_get_weather(self, client, sample_weather_data):
         """Test get_weather convenience method."""
@@ -180,6 +210,57 @@ class TestMCPClient:
             assert "error" in result["todos"]
             assert "error" in result["commute"]
 
+    @pytest.mark.asyncio
+    async def test_get_all_morning_data_runs_concurrently(self, client, mock_settings):
+        """Test get_all_morning_data overlaps the four tool calls."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_call(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        with patch.object(client, "get_weather", side_effect=slow_call), \
+             patch.object(client, "get_calendar_events", side_effect=slow_call), \
+             patch.object(client, "get_todos", side_effect=slow_call), \
+             patch.object(client, "get_commute_options", side_effect=slow_call):
+
+            result = await client.get_all_morning_data("2025-01-15")
+
+        assert set(result) == {"weather", "calendar", "todos", "commute"}
+        assert max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_bounded(self, client, sample_todos_data):
+        """Test no more than mcp_max_concurrency requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def tracked_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.content = json.dumps(sample_todos_data).encode()
+            return response
+
+        http_client = MagicMock()
+        http_client.post = AsyncMock(side_effect=tracked_post)
+
+        with patch.object(client.settings, "mcp_max_concurrency", 2), \
+             patch.object(MCPClient, "_semaphores", {}), \
+             patch.object(MCPClient, "get_client", AsyncMock(return_value=http_client)):
+            await asyncio.gather(*(client.get_todos(f"bucket-{i}") for i in range(6)))
+
+        assert http_client.post.await_count == 6
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_health_check_success(self, client):
         """Test health_check returns True when server is healthy."""
@@ -208,3 +289,171 @@ class TestMCPClient:
 
             result = await client.health_check()
             assert result is False
+
+
+class TestSharedMCPClient:
+    """Tests for the process-wide MCP client."""
+
+    def test_get_mcp_client_returns_singleton(self, mock_settings):
+        """Test that get_mcp_client reuses one instance until reset."""
+        from daily_ai_agent.services.mcp_client import get_mcp_client, reset_mcp_client
+
+        first = get_mcp_client()
+        assert get_mcp_client() is first
+
+        reset_mcp_client()
+        assert get_mcp_client() is not first
+
+    def test_http_client_is_pooled_per_event_loop(self, mock_settings):
+        """Test each event loop gets its own pooled client, reused within the loop."""
+        async def get_twice():
+            first = await MCPClient.get_client()
+            second = await MCPClient.get_client()
+            assert first is second
+            await MCPClient.close_client()
+            return first
+
+        first_loop_client = asyncio.run(get_twice())
+        second_loop_client = asyncio.run(get_twice())
+
+        assert first_loop_client is not second_loop_client
+        assert first_loop_client.is_closed
+
+    def test_tools_share_the_client(self, mock_settings):
+        """Test that different tools get the same MCP client."""
+        from daily_ai_agent.agent.tools import TodoTool, WeatherTool
+
+        assert WeatherTool()._get_mcp_client() is TodoTool()._get_mcp_client()
+
+    def test_background_client_closed_at_exit(self, mock_settings):
+        """Test the exit hook closes the client pooled on the background loop."""
+        from daily_ai_agent.services.mcp_client import close_background_client
+        from daily_ai_agent.utils.async_helpers import run_coroutine_sync
+
+        http_client = run_coroutine_sync(MCPClient.get_client())
+        close_background_client()
+
+        assert http_client.is_closed
+        assert run_coroutine_sync(MCPClient.get_client()) is not http_client
+
+
+class TestMCPResponseCache:
+    """Tests for caching of read-only MCP tool responses."""
+
+    @pytest.fixture
+    def client(self, mock_settings) -> MCPClient:
+        """Create MCPClient instance with mocked settings."""
+        return MCPClient()
+
+    @staticmethod
+    def _response(data):
+        response = MagicMock()
+        response.content = json.dumps(data).encode()
+        return response
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_is_served_from_cache(self, client, sample_weather_data):
+        """Test identical weather calls hit the server once."""
+        with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = self._response(sample_weather_data)
+
+            first = await client.get_weather("San Francisco")
+            second = await client.get_weather("San Francisco")
+
+            assert first == second == sample_weather_data
+            mock_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_inputs_are_cached_separately(self, client, sample_weather_data):
+        """Test cache keys include the tool input."""
+        with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = self._response(sample_weather_data)
+
+            await client.get_weather("San Francisco")
+            await client.get_weather("Oakland")
+
+            assert mock_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(self, client, sample_weather_data):
+        """Test concurrent misses for the same input are coalesced."""
+        async def slow_request(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return self._response(sample_weather_data)
+
+        with patch.object(client, "_request_with_retry", side_effect=slow_request) as mock_request:
+            results = await asyncio.gather(*(client.get_weather("San Francisco") for _ in range(5)))
+
+            assert all(result == sample_weather_data for result in results)
+            assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_financial_symbol_order_shares_cache_entry(self, client, sample_financial_data):
+        """Test the same portfolio in any order or case hits one cache entry."""
+        with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = self._response(sample_financial_data)
+
+            await client.get_financial_data(["MSFT", "BTC"])
+            await client.get_financial_data(["btc", "MSFT", "BTC"])
+
+            mock_request.assert_awaited_once()
+            assert mock_request.call_args.kwargs["json_data"]["symbols"] == ["BTC", "MSFT"]
+
+    @pytest.mark.asyncio
+    async def test_live_tools_coalesce_concurrent_calls(self, client, sample_todos_data):
+        """Test zero-TTL tools still share identical in-flight requests."""
+        async def slow_request(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return self._response(sample_todos_data)
+
+        with patch.object(client, "_request_with_retry", side_effect=slow_request) as mock_request:
+            await asyncio.gather(client.get_todos("work"), client.get_todos("work"), client.get_todos("home"))
+
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_tools_always_call_server(self, client, sample_todos_data):
+        """Test zero-TTL tools are not cached between calls."""
+        with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = self._response(sample_todos_data)
+
+            await client.get_todos("work")
+            await client.get_todos("work")
+
+            assert mock_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_calendar_write_invalidates_event_listings(self, client, sample_calendar_data):
+        """Test creating an event clears cached calendar reads."""
+        with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = self._response(sample_calendar_data)
+
+            await client.get_calendar_events("2024-01-15")
+            await client.call_tool("calendar.create_event", {"title": "Standup"})
+            await client.get_calendar_events("2024-01-15")
+
+            assert mock_request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_calls_are_not_cached(self, client, sample_weather_data):
+        """Test errors are retried on the next call instead of cached."""
+        with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = [httpx.ConnectError("down"), self._response(sample_weather_data)]
+
+            with pytest.raises(Exception):
+                await client.get_weather("San Francisco")
+            result = await client.get_weather("San Francisco")
+
+            assert result == sample_weather_data
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_fail_fast(self, client):
+        """Test an identical read that keeps failing stops reaching the server."""
+        with patch.object(client, "_request_with_retry", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = MCPError("Bad location", status_code=400)
+
+            for _ in range(5):
+                with pytest.raises(MCPError):
+                    await client.get_weather("Nowhere")
+
+            assert mock_request.await_count == 3
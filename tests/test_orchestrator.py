@@ -0,0 +1,354 @@
+"""Tests for agent orchestrator construction and prompt handling."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+
+class TestPromptCache:
+    """Tests for the memoized prompt template builder."""
+
+    @pytest.fixture(autouse=True)
+    def clear_prompt_cache(self):
+        """Start every test with an empty prompt cache."""
+        from daily_ai_agent.agent.orchestrator import _build_prompt
+        _build_prompt.cache_clear()
+        yield
+        _build_prompt.cache_clear()
+
+    def test_same_inputs_return_same_template(self):
+        """Test that identical inputs reuse the cached template."""
+        from daily_ai_agent.agent.orchestrator import _build_prompt
+
+        first = _build_prompt("Kevin", "San Francisco", "Home", "Office", True)
+        second = _build_prompt("Kevin", "San Francisco", "Home", "Office", True)
+
+        assert first is second
+
+    def test_date_is_a_prompt_variable(self):
+        """Test that the date is filled in at invoke time, not baked into the template."""
+        from daily_ai_agent.agent.orchestrator import _build_prompt
+
+        prompt = _build_prompt("Kevin", "San Francisco", "Home", "Office", False)
+
+        assert "current_date" in prompt.input_variables
+        assert "current_day" in prompt.input_variables
+
+    def test_memory_flag_controls_history_placeholder(self):
+        """Test that chat_history is only a prompt variable when memory is enabled."""
+        from daily_ai_agent.agent.orchestrator import _build_prompt
+
+        with_memory = _build_prompt("Kevin", "SF", "Home", "Office", True)
+        without_memory = _build_prompt("Kevin", "SF", "Home", "Office", False)
+
+        assert "chat_history" in with_memory.input_variables
+        assert "chat_history" not in without_memory.input_variables
+
+    def test_orchestrators_share_prompt(self, mock_settings):
+        """Test that two orchestrators with the same settings share one template and agent."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent") as mock_create_agent, \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor"), \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            AgentOrchestrator()
+            AgentOrchestrator()
+
+            # Identical LLM, tools and prompt: the agent is wired only once
+            mock_create_agent.assert_called_once()
+
+    def test_static_system_block_has_no_dynamic_values(self):
+        """Test that the first system message is identical across days and users."""
+        from daily_ai_agent.agent.orchestrator import AGENT_SYSTEM_PROMPT, _build_prompt
+
+        def system_messages(date, *args):
+            prompt = _build_prompt(*args)
+            return prompt.format_messages(
+                input="hi", chat_history=[], current_date=date, current_day="Someday"
+            )
+
+        first = system_messages("2025-01-15", "Kevin", "San Francisco", "Home", "Office", True)
+        second = system_messages("2025-01-16", "Alex", "New York", "Apt", "HQ", True)
+
+        assert first[0].content == second[0].content == AGENT_SYSTEM_PROMPT
+        assert "2025-01-15" in first[1].content
+        assert "Kevin" in first[1].content
+
+
+class TestDateContext:
+    """Tests for the date variables passed to the agent."""
+
+    @pytest.mark.asyncio
+    async def test_chat_passes_current_date(self, mock_settings):
+        """Test that chat() supplies the date variables on every invoke."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.return_value = {"output": "Hi"}
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator()
+            await orchestrator.chat("Hello")
+
+            payload = mock_agent.ainvoke.call_args[0][0]
+            assert payload["current_date"] == datetime.now().strftime("%Y-%m-%d")
+            assert "current_day" in payload
+
+
+class TestSharedOrchestrator:
+    """Tests for the process-wide orchestrator and LLM client reuse."""
+
+    def test_get_orchestrator_returns_singleton(self, mock_settings):
+        """Test that get_orchestrator builds the orchestrator only once."""
+        with patch("daily_ai_agent.agent.orchestrator.AgentOrchestrator") as mock_class:
+            from daily_ai_agent.agent.orchestrator import get_orchestrator, reset_orchestrator
+
+            first = get_orchestrator()
+            second = get_orchestrator()
+
+            assert first is second
+            mock_class.assert_called_once()
+
+            reset_orchestrator()
+            get_orchestrator()
+            assert mock_class.call_count == 2
+
+    def test_orchestrators_share_llm_client(self, mock_settings):
+        """Test that ChatOpenAI is constructed once for identical settings."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI") as mock_llm_class, \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor"), \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            AgentOrchestrator()
+            AgentOrchestrator()
+
+            mock_llm_class.assert_called_once()
+
+
+class TestChatBatch:
+    """Tests for concurrent multi-input chat."""
+
+    @pytest.fixture
+    def orchestrator_with_mock_agent(self, mock_settings):
+        """Create an orchestrator with a mocked agent executor."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+            mock_agent = AsyncMock()
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator(use_cached_tools=True, enable_memory=True)
+
+            yield orchestrator, mock_agent
+
+    @pytest.mark.asyncio
+    async def test_chat_batch_uses_abatch(self, orchestrator_with_mock_agent):
+        """Test that all inputs go to the agent in a single abatch call."""
+        orchestrator, mock_agent = orchestrator_with_mock_agent
+        mock_agent.abatch.return_value = [{"output": "A"}, {"output": "B"}]
+
+        responses = await orchestrator.chat_batch(["First", "Second"])
+
+        assert responses == ["A", "B"]
+        mock_agent.abatch.assert_called_once()
+        payloads = mock_agent.abatch.call_args[0][0]
+        assert [p["input"] for p in payloads] == ["First", "Second"]
+        assert mock_agent.abatch.call_args[1]["config"]["max_concurrency"] == 5
+        assert orchestrator.get_memory_length() == 0
+
+    @pytest.mark.asyncio
+    async def test_chat_batch_accepts_separate_histories(self, orchestrator_with_mock_agent):
+        """Test that (text, history) tuples carry their own session history."""
+        from langchain_core.messages import HumanMessage
+
+        orchestrator, mock_agent = orchestrator_with_mock_agent
+        mock_agent.abatch.return_value = [{"output": "A"}]
+        history = [HumanMessage(content="Earlier")]
+
+        await orchestrator.chat_batch([("Follow up", history)])
+
+        payload = mock_agent.abatch.call_args[0][0][0]
+        assert payload["chat_history"] == history
+
+    @pytest.mark.asyncio
+    async def test_chat_batch_reports_per_input_errors(self, orchestrator_with_mock_agent):
+        """Test that one failing input doesn't fail the whole batch."""
+        orchestrator, mock_agent = orchestrator_with_mock_agent
+        mock_agent.abatch.return_value = [{"output": "A"}, Exception("boom")]
+
+        responses = await orchestrator.chat_batch(["First", "Second"])
+
+        assert responses[0] == "A"
+        assert "boom" in responses[1]
+
+
+class TestAgentCache:
+    """Tests for reuse of the compiled agent executor."""
+
+    def test_agent_rebuilt_for_different_tools(self, mock_settings):
+        """Test that a different tool set gets its own executor."""
+        from unittest.mock import MagicMock
+
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent") as mock_create_agent, \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor"):
+
+            from daily_ai_agent.agent.orchestrator import _build_agent, _build_prompt
+            from daily_ai_agent.agent.tools import TodoTool, WeatherTool
+
+            llm = MagicMock()
+            prompt = _build_prompt("Kevin", "SF", "Home", "Office", True)
+            weather, todos = WeatherTool(), TodoTool()
+
+            first = _build_agent(llm, [weather], prompt)
+            second = _build_agent(llm, [weather], prompt)
+            _build_agent(llm, [weather, todos], prompt)
+
+            assert first is second
+            assert mock_create_agent.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_trace_logs_tool_calls(self, mock_settings):
+        """Test that tracing logs the tool runs, not just the agent's decisions."""
+        from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+        from langchain_core.messages import AIMessage
+        from langchain_core.tools import tool
+        from loguru import logger
+
+        class ToolCallingFakeModel(FakeMessagesListChatModel):
+            def bind_tools(self, tools, **kwargs):
+                return self
+
+        @tool
+        def get_weather(location: str) -> str:
+            """Get the weather for a location."""
+            return f"Sunny in {location}"
+
+        llm = ToolCallingFakeModel(responses=[
+            AIMessage(content="", tool_calls=[{"name": "get_weather", "args": {"location": "SF"}, "id": "call_1"}]),
+            AIMessage(content="It's sunny."),
+        ])
+        records = []
+        sink_id = logger.add(lambda message: records.append(message.record["message"]), level="DEBUG")
+
+        try:
+            with patch("daily_ai_agent.agent.orchestrator.get_settings", return_value=mock_settings), \
+                 patch("daily_ai_agent.agent.orchestrator.ChatOpenAI", return_value=llm), \
+                 patch("daily_ai_agent.agent.orchestrator.get_cached_tools", return_value=[get_weather]):
+
+                from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+                orchestrator = AgentOrchestrator(enable_memory=False)
+
+                assert await orchestrator.chat("Weather in SF?") == "It's sunny."
+        finally:
+            logger.remove(sink_id)
+
+        assert "Tool started: get_weather" in records
+        assert "Tool finished: Sunny in SF" in records
+
+
+class TestStreamSmartBriefing:
+    """Tests for the streaming morning briefing."""
+
+    @pytest.mark.asyncio
+    async def test_streams_final_answer_tokens(self, mock_settings):
+        """Test that only text chunks from the chat model are yielded."""
+        from unittest.mock import MagicMock
+
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+
+            async def fake_events(payload, config, version):
+                yield {"event": "on_tool_start", "data": {}}
+                yield {"event": "on_chat_model_stream", "data": {"chunk": MagicMock(content="")}}
+                yield {"event": "on_chat_model_stream", "data": {"chunk": MagicMock(content="Good ")}}
+                yield {"event": "on_chat_model_stream", "data": {"chunk": MagicMock(content="morning!")}}
+
+            mock_agent = MagicMock()
+            mock_agent.astream_events = fake_events
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator()
+
+            chunks = [chunk async for chunk in orchestrator.stream_smart_briefing()]
+            assert chunks == ["Good ", "morning!"]
+
+            # The assembled briefing is cached for the next request
+            cached = [chunk async for chunk in orchestrator.stream_smart_briefing()]
+            assert cached == ["Good morning!"]
+
+    @pytest.mark.asyncio
+    async def test_briefing_with_failed_tool_is_not_cached(self, mock_settings):
+        """Test that a briefing streamed after a tool error is generated again next time."""
+        from unittest.mock import MagicMock
+
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor_class, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            from daily_ai_agent.agent.tools import get_all_tools
+            mock_tools.return_value = get_all_tools()
+            runs = 0
+
+            async def fake_events(payload, config, version):
+                nonlocal runs
+                runs += 1
+                yield {
+                    "event": "on_tool_end",
+                    "name": "get_morning_briefing",
+                    "data": {"output": "Error getting morning briefing: connection refused"},
+                }
+                yield {"event": "on_chat_model_stream", "data": {"chunk": MagicMock(content="No data yet.")}}
+
+            mock_agent = MagicMock()
+            mock_agent.astream_events = fake_events
+            mock_executor_class.return_value = mock_agent
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator()
+
+            [chunk async for chunk in orchestrator.stream_smart_briefing()]
+            [chunk async for chunk in orchestrator.stream_smart_briefing()]
+
+            assert runs == 2
+
+
+class TestSharedLLMService:
+    """Tests for LLM client reuse between the agent and the LLM service."""
+
+    def test_llm_service_reuses_agent_llm(self, mock_settings):
+        """Test that the LLM service gets the same chat model as the agent."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI") as mock_llm_class, \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent") as mock_create_agent, \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor"), \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools") as mock_tools:
+
+            mock_tools.return_value = []
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator()
+
+            assert orchestrator.llm_service.llm is mock_llm_class.return_value
+            assert mock_create_agent.call_args[0][0] is orchestrator.llm_service.llm
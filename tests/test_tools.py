@@ -1,5 +1,6 @@
 """Tests for LangChain tool implementations."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
@@ -7,6 +8,7 @@ from daily_ai_agent.agent.tools import (
     WeatherTool,
     CalendarTool,
     CalendarRangeTool,
+    CalendarCreateTool,
     TodoTool,
     CommuteTool,
     CommuteOptionsTool,
@@ -14,6 +16,7 @@ from daily_ai_agent.agent.tools import (
     MorningBriefingTool,
     get_all_tools,
 )
+from daily_ai_agent.utils.error_handlers import MCPError
 
 
 class TestWeatherTool:
@@ -56,6 +59,34 @@ class TestWeatherTool:
             result = await tool._arun("San Francisco", "today")
 
             assert "Error" in result
+            assert "retrying" not in result
+
+    @pytest.mark.asyncio
+    async def test_arun_fills_missing_fields(self, tool):
+        """Test missing weather fields fall back to defaults."""
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.get_weather = AsyncMock(return_value={"summary": "Sunny", "temp_hi": 75})
+            mock_get_client.return_value = mock_client
+
+            result = await tool._arun("Oakland", "today")
+
+            assert result == (
+                "Weather for Oakland: Sunny, High: 75°F, Low: N/A°F, Precipitation: 0%"
+            )
+
+    @pytest.mark.asyncio
+    async def test_arun_flags_retriable_errors(self, tool):
+        """Test transient MCP failures tell the agent a retry may work."""
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.get_weather = AsyncMock(side_effect=MCPError("timed out", retriable=True))
+            mock_get_client.return_value = mock_client
+
+            result = await tool._arun("San Francisco", "today")
+
+            assert result.startswith("Error getting weather")
+            assert "worth retrying" in result
 
 
 class TestCalendarTool:
@@ -82,6 +113,12 @@ class TestCalendarTool:
 
             assert "2 events" in result
             assert "Team Standup" in result
+            assert "\\n" not in result
+            assert result.splitlines() == [
+                "2 events on 2025-01-15:",
+                "- Team Standup at 09:00 AM",
+                "- Lunch with John at 12:00 PM",
+            ]
 
     @pytest.mark.asyncio
     async def test_arun_no_events(self, tool):
@@ -132,6 +169,60 @@ class TestCalendarRangeTool:
             assert "2025-01-15" in result
             assert "2025-01-16" in result
 
+    @pytest.mark.asyncio
+    async def test_arun_sorts_days_and_caps_events(self, tool):
+        """Test days are listed in order with at most 3 events each."""
+        events_data = {
+            "events": [
+                {"title": "Late", "start_time": "2025-01-16T10:00:00"},
+                {"title": "A", "start_time": "2025-01-15T09:00:00"},
+                {"title": "B", "start_time": "2025-01-15T10:00:00"},
+                {"title": "Offsite", "start_time": "2025-01-15"},
+                {"title": "D", "start_time": "2025-01-15T16:00:00"},
+            ],
+            "total_events": 5,
+        }
+
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.get_calendar_events_range = AsyncMock(return_value=events_data)
+            mock_get_client.return_value = mock_client
+
+            result = await tool._arun("2025-01-15", "2025-01-16")
+
+            assert result.index("2025-01-15") < result.index("2025-01-16")
+            assert "A at 09:00" in result
+            assert "Offsite (all day)" in result
+            assert "D at" not in result
+            assert "... and 1 more" in result
+
+
+class TestCalendarCreateTool:
+    """Tests for CalendarCreateTool."""
+
+    @pytest.mark.asyncio
+    async def test_arun_omits_unset_optional_fields(self):
+        """Test only provided optional fields are sent to the MCP server."""
+        tool = CalendarCreateTool()
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.call_tool = AsyncMock(return_value={"success": True, "message": "Created"})
+            mock_get_client.return_value = mock_client
+
+            result = await tool._arun(
+                "Standup", "2025-01-15T09:00:00", "2025-01-15T09:15:00", location="Room 4"
+            )
+
+            assert "Created" in result
+            mock_client.call_tool.assert_awaited_once_with("calendar.create_event", {
+                "title": "Standup",
+                "start_time": "2025-01-15T09:00:00",
+                "end_time": "2025-01-15T09:15:00",
+                "calendar_name": "primary",
+                "all_day": False,
+                "location": "Room 4",
+            })
+
 
 class TestTodoTool:
     """Tests for TodoTool."""
@@ -227,6 +318,15 @@ class TestCommuteOptionsTool:
             assert "Recommendation" in result
             assert "transit" in result.lower() or "driving" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_arun_skips_call_when_no_legs_requested(self, tool):
+        """Test _arun doesn't call the server when both legs are disabled."""
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            result = await tool._arun("to_work", include_driving=False, include_transit=False)
+
+            assert "No commute options requested" in result
+            mock_get_client.assert_not_called()
+
 
 class TestFinancialTool:
     """Tests for FinancialTool."""
@@ -245,7 +345,7 @@ class TestFinancialTool:
         """Test _arun formats prices correctly."""
         with patch.object(tool, "_get_mcp_client") as mock_get_client:
             mock_client = MagicMock()
-            mock_client.call_tool = AsyncMock(return_value=sample_financial_data)
+            mock_client.get_financial_data = AsyncMock(return_value=sample_financial_data)
             mock_get_client.return_value = mock_client
 
             result = await tool._arun(["MSFT", "BTC"], "mixed")
@@ -274,7 +374,7 @@ class TestMorningBriefingTool:
         with patch.object(tool, "_get_mcp_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.get_all_morning_data = AsyncMock(return_value=sample_morning_data)
-            mock_client.call_tool = AsyncMock(return_value=sample_financial_data)
+            mock_client.get_financial_data = AsyncMock(return_value=sample_financial_data)
             mock_get_client.return_value = mock_client
 
             result = await tool._arun()
@@ -284,6 +384,63 @@ class TestMorningBriefingTool:
             assert "Todos" in result
 
 
+    @pytest.mark.asyncio
+    async def test_arun_fetches_concurrently(self, tool, sample_morning_data, sample_financial_data):
+        """Test morning data and financial data are requested at the same time."""
+        in_flight = 0
+        max_in_flight = 0
+
+        def slow(value):
+            async def call(*args):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return value
+            return call
+
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.get_all_morning_data = AsyncMock(side_effect=slow(sample_morning_data))
+            mock_client.get_financial_data = AsyncMock(side_effect=slow(sample_financial_data))
+            mock_get_client.return_value = mock_client
+
+            await tool._arun()
+
+            assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_arun_survives_financial_failure(self, tool, sample_morning_data):
+        """Test the briefing is still produced when financial data fails."""
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.get_all_morning_data = AsyncMock(return_value=sample_morning_data)
+            mock_client.get_financial_data = AsyncMock(side_effect=Exception("Markets closed"))
+            mock_get_client.return_value = mock_client
+
+            result = await tool._arun()
+
+            assert "Weather" in result
+            assert "Markets" not in result
+
+    @pytest.mark.asyncio
+    async def test_arun_uses_configured_symbols(self, tool, sample_morning_data, sample_financial_data):
+        """Test the briefing tracks the BRIEFING_SYMBOLS setting."""
+        from daily_ai_agent.models.config import Settings
+
+        with patch.dict("os.environ", {"BRIEFING_SYMBOLS": "VOO, SMR,"}), \
+             patch("daily_ai_agent.agent.tools.get_settings", return_value=Settings()), \
+             patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.get_all_morning_data = AsyncMock(return_value=sample_morning_data)
+            mock_client.get_financial_data = AsyncMock(return_value=sample_financial_data)
+            mock_get_client.return_value = mock_client
+
+            await tool._arun()
+
+            mock_client.get_financial_data.assert_awaited_once_with(("VOO", "SMR"), "mixed")
+
 class TestGetAllTools:
     """Tests for get_all_tools function."""
 
@@ -307,3 +464,61 @@ class TestGetAllTools:
 
         for tool in tools:
             assert len(tool.description) > 0, f"Tool {tool.name} missing description"
+
+
+class TestToolSpecs:
+    """Tests for precomputed OpenAI tool specs."""
+
+    def test_specs_match_tools(self):
+        """Test that one function spec is produced per tool, in order."""
+        from daily_ai_agent.agent.tools import get_all_tools, get_openai_tool_specs
+
+        tools = get_all_tools()
+        specs = get_openai_tool_specs(tools)
+
+        assert [spec["function"]["name"] for spec in specs] == [tool.name for tool in tools]
+        assert "location" in specs[0]["function"]["parameters"]["properties"]
+
+    def test_specs_are_converted_once(self):
+        """Test that repeated lookups reuse the converted spec."""
+        from daily_ai_agent.agent.tools import WeatherTool, get_openai_tool_specs
+
+        first = get_openai_tool_specs([WeatherTool()])[0]
+        second = get_openai_tool_specs([WeatherTool()])[0]
+
+        assert first is second
+
+    def test_spec_tokens_are_counted_once(self):
+        """Test that each tool spec is serialized and tokenized only once."""
+        from daily_ai_agent.agent import tools as tools_module
+        from daily_ai_agent.agent.tools import WeatherTool, TodoTool, count_tool_spec_tokens
+
+        with patch.dict(tools_module._tool_spec_tokens, clear=True), \
+             patch("daily_ai_agent.agent.tools.count_tokens", return_value=7) as mock_count:
+            first = count_tool_spec_tokens([WeatherTool(), TodoTool()])
+            second = count_tool_spec_tokens([WeatherTool(), TodoTool()])
+
+        assert first == second == 14
+        assert mock_count.call_count == 2
+
+
+class TestMCPToolBase:
+    """Tests for the shared MCPTool base class."""
+
+    def test_all_tools_share_the_base(self):
+        """Test every tool gets the shared client and sync wrapper from MCPTool."""
+        from daily_ai_agent.agent.tools import MCPTool
+
+        assert all(isinstance(tool, MCPTool) for tool in get_all_tools())
+
+    def test_sync_run_forwards_arguments(self, sample_commute_data):
+        """Test the inherited _run passes positional and keyword args to _arun."""
+        tool = CommuteTool()
+        with patch.object(tool, "_get_mcp_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.get_commute = AsyncMock(return_value=sample_commute_data)
+            mock_get_client.return_value = mock_client
+
+            tool._run("Home", "Office", mode="transit")
+
+            mock_client.get_commute.assert_awaited_once_with("Home", "Office", "transit")
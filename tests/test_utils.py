@@ -14,9 +14,14 @@ from daily_ai_agent.utils.error_handlers import (
 )
 from daily_ai_agent.utils.async_helpers import (
     run_async,
+    run_coroutine_sync,
     gather_with_timeout,
     retry_async,
+    AsyncTTLCache,
+    new_event_loop,
+    gather_named,
 )
+from daily_ai_agent.utils.dates import get_today, now_iso, today_str, reset_today_cache
 from daily_ai_agent.utils.constants import (
     APP_VERSION,
     FINANCIAL_SYMBOLS,
@@ -98,6 +103,13 @@ class TestErrorHandlers:
         result = safe_async_call(error_func, default="default_value")
         assert result == "default_value"
 
+    def test_safe_async_call_reuses_background_loop(self):
+        """Test safe_async_call runs coroutines on one shared loop instead of a new one per call."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert safe_async_call(current_loop) is safe_async_call(current_loop)
+
 
 class TestAsyncHelpers:
     """Tests for async helper utilities."""
@@ -112,6 +124,25 @@ class TestAsyncHelpers:
         result = async_func(5)
         assert result == 10
 
+    def test_run_coroutine_sync_reuses_loop(self):
+        """Test run_coroutine_sync runs every call on the same long-lived loop."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_coroutine_sync(current_loop())
+        second = run_coroutine_sync(current_loop())
+
+        assert first is second
+        assert first.is_running()
+
+    @pytest.mark.asyncio
+    async def test_run_coroutine_sync_inside_running_loop(self):
+        """Test run_coroutine_sync works when the caller already has a loop."""
+        async def double(x: int) -> int:
+            return x * 2
+
+        assert run_coroutine_sync(double(21)) == 42
+
     @pytest.mark.asyncio
     async def test_gather_with_timeout_success(self):
         """Test gather_with_timeout runs coroutines concurrently."""
@@ -188,6 +219,180 @@ class TestAsyncHelpers:
                 retryable_exceptions=(ConnectionError,),
             )
 
+    @pytest.mark.asyncio
+    async def test_gather_named_keeps_names_and_errors(self):
+        """Test gather_named maps each name to its result or exception."""
+        async def ok():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def fails():
+            raise ValueError("boom")
+
+        results = await gather_named({"ok": ok(), "fails": fails()})
+
+        assert results["ok"] == "value"
+        assert isinstance(results["fails"], ValueError)
+
+    def test_new_event_loop_falls_back_without_uvloop(self):
+        """Test new_event_loop uses the stdlib loop when uvloop is missing."""
+        with patch.dict("sys.modules", {"uvloop": None}):
+            loop = new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.BaseEventLoop)
+            assert loop.run_until_complete(asyncio.sleep(0, result="ok")) == "ok"
+        finally:
+            loop.close()
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_expires_entries(self):
+        """Test AsyncTTLCache refetches once an entry is stale."""
+        cache = AsyncTTLCache(ttl_seconds=60)
+        fetch = AsyncMock(side_effect=["first", "second"])
+
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=0):
+            assert await cache.get_or_fetch("key", fetch) == "first"
+            assert await cache.get_or_fetch("key", fetch) == "first"
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=61):
+            assert await cache.get_or_fetch("key", fetch) == "second"
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_evicts_least_recently_used(self):
+        """Test AsyncTTLCache stays within max_entries."""
+        cache = AsyncTTLCache(ttl_seconds=60, max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.get_or_fetch(key, AsyncMock(return_value=key))
+
+        assert len(cache) == 2
+        fetch = AsyncMock(return_value="fresh")
+        assert await cache.get_or_fetch("a", fetch) == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_joiner_survives_cancelled_leader(self):
+        """Test cancelling the caller that started a fetch doesn't cancel callers waiting on it."""
+        cache = AsyncTTLCache(ttl_seconds=60)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(cache.get_or_fetch("key", fetch))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(cache.get_or_fetch("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await joiner == "value"
+        assert leader.cancelled()
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_fails_fast_after_repeated_failures(self):
+        """Test a key that keeps failing stops fetching until its window ends."""
+        cache = AsyncTTLCache(ttl_seconds=0, failure_threshold=2, failure_window_seconds=30)
+        fetch = AsyncMock(side_effect=[ValueError("down"), ValueError("down"), "back"])
+
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=0):
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    await cache.get_or_fetch("key", fetch)
+            assert fetch.await_count == 2
+            assert await cache.get_or_fetch("other", AsyncMock(return_value="ok")) == "ok"
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=31):
+            assert await cache.get_or_fetch("key", fetch) == "back"
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_fail_fast_traceback_does_not_grow(self):
+        """Test re-raising the stored failure doesn't pile up frames from earlier hits."""
+        cache = AsyncTTLCache(ttl_seconds=0, failure_threshold=1, failure_window_seconds=30)
+        fetch = AsyncMock(side_effect=ValueError("down"))
+
+        def traceback_depth(error):
+            depth, tb = 0, error.__traceback__
+            while tb is not None:
+                depth, tb = depth + 1, tb.tb_next
+            return depth
+
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=0):
+            with pytest.raises(ValueError):
+                await cache.get_or_fetch("key", fetch)
+            depths = []
+            for _ in range(3):
+                with pytest.raises(ValueError) as exc_info:
+                    await cache.get_or_fetch("key", fetch)
+                depths.append(traceback_depth(exc_info.value))
+
+        assert depths[0] == depths[1] == depths[2]
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_serves_stale_value_when_refresh_fails(self):
+        """Test an expired value stands in for a failed refresh within the stale window."""
+        cache = AsyncTTLCache(ttl_seconds=60, stale_if_error_seconds=600)
+        fetch = AsyncMock(side_effect=["first", ValueError("down"), ValueError("down")])
+
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=0):
+            assert await cache.get_or_fetch("key", fetch) == "first"
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=61):
+            assert await cache.get_or_fetch("key", fetch) == "first"
+        with patch("daily_ai_agent.utils.async_helpers.time.monotonic", return_value=661):
+            with pytest.raises(ValueError):
+                await cache.get_or_fetch("key", fetch)
+
+
+class TestDates:
+    """Tests for the cached today helpers."""
+
+    @pytest.fixture(autouse=True)
+    def clear_today_cache(self):
+        """Start every test with an empty date cache."""
+        reset_today_cache()
+        yield
+        reset_today_cache()
+
+    def test_today_str_matches_current_date(self):
+        """Test today_str returns today's ISO date."""
+        from datetime import date
+
+        assert today_str() == date.today().isoformat()
+
+    def test_get_today_reuses_strings(self):
+        """Test repeated calls return the same cached strings."""
+        assert get_today() is get_today()
+
+    def test_get_today_refreshes_when_date_changes(self):
+        """Test the cache picks up a new date after the recheck interval."""
+        from datetime import date
+
+        with patch("daily_ai_agent.utils.dates.date") as mock_date, \
+             patch("daily_ai_agent.utils.dates.time") as mock_time:
+            mock_date.today.return_value = date(2025, 1, 15)
+            mock_time.monotonic.return_value = 1000.0
+            assert today_str() == "2025-01-15"
+
+            # Within the recheck interval the date is not looked up again
+            mock_date.today.return_value = date(2025, 1, 16)
+            mock_time.monotonic.return_value = 1030.0
+            assert today_str() == "2025-01-15"
+
+            mock_time.monotonic.return_value = 1061.0
+            assert get_today() == ("2025-01-16", "Thursday, January 16, 2025")
+
+    def test_now_iso_is_reused_within_a_second(self):
+        """Test now_iso rebuilds its string only when the second changes."""
+        from datetime import datetime
+
+        with patch("daily_ai_agent.utils.dates.time") as mock_time:
+            mock_time.time.return_value = 1736928000.2
+            first = now_iso()
+            mock_time.time.return_value = 1736928000.9
+            assert now_iso() is first
+            mock_time.time.return_value = 1736928001.1
+            assert now_iso() == datetime.fromtimestamp(1736928001).isoformat()
+
 
 class TestConstants:
     """Tests for constants module."""
@@ -220,3 +425,24 @@ class TestConstants:
         assert "driving" in TRANSPORT_MODES
         assert "transit" in TRANSPORT_MODES
         assert "walking" in TRANSPORT_MODES
+
+
+class TestTokens:
+    """Tests for token counting helpers."""
+
+    def test_count_tokens_estimates_without_tiktoken(self):
+        """Test the length-based estimate when no encoding is available."""
+        from daily_ai_agent.utils.tokens import count_tokens
+
+        with patch("daily_ai_agent.utils.tokens._get_encoding", return_value=None):
+            assert count_tokens("a" * 40) == 11
+
+    def test_count_tokens_uses_encoding(self):
+        """Test that the tiktoken encoding is used when available."""
+        from unittest.mock import MagicMock
+        from daily_ai_agent.utils.tokens import count_tokens
+
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2, 3]
+        with patch("daily_ai_agent.utils.tokens._get_encoding", return_value=encoding):
+            assert count_tokens("hello there") == 3
@@ -0,0 +1,22 @@
+"""Tests for the agent warm-up."""
+
+from unittest.mock import patch
+
+from daily_ai_agent.agent.warmup import warmup
+
+
+class TestWarmup:
+    """Tests for warmup."""
+
+    def test_warmup_runs_each_step(self):
+        """Test warm-up loads the tokenizer, tools and specs and times each step."""
+        with patch("daily_ai_agent.agent.warmup.count_tokens") as mock_count, \
+             patch("daily_ai_agent.agent.warmup.get_cached_tools", return_value=["tool"]) as mock_tools, \
+             patch("daily_ai_agent.agent.warmup.count_tool_spec_tokens") as mock_specs:
+            timings = warmup()
+
+        mock_count.assert_called_once()
+        mock_tools.assert_called_once()
+        mock_specs.assert_called_once_with(["tool"])
+        assert set(timings) == {"tokenizer", "tools", "tool_specs"}
+        assert all(seconds >= 0 for seconds in timings.values())